@@ -2,9 +2,10 @@
 Base class for all prompt strategies used in the BMW Agents framework.
 """
 
+import functools
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from bmw_agents.utils.llm_providers import LLMProvider
 from bmw_agents.utils.logger import get_logger
@@ -12,6 +13,18 @@ from bmw_agents.utils.logger import get_logger
 logger = get_logger("prompt_strategies.base")
 
 
+@functools.lru_cache(maxsize=64)
+def _read_template(path: str) -> str:
+    """
+    Read a template file, reusing earlier reads of the same file.
+
+    Templates are static configuration, so strategies created repeatedly during a
+    process share one read. Call ``_read_template.cache_clear()`` after editing one.
+    """
+    with open(path, "r") as f:
+        return f.read()
+
+
 class Message:
     """
     Represents a message in a conversation.
@@ -85,8 +98,7 @@ class PromptStrategy(ABC):
             else:
                 abs_template_path = template_path
 
-            with open(abs_template_path, "r") as f:
-                self.template = f.read()
+            self.template = _read_template(os.path.abspath(abs_template_path))
         elif template_content:
             self.template = template_content
         else:
@@ -171,7 +183,10 @@ class PromptStrategy(ABC):
         pass
 
     async def get_llm_response(
-        self, temperature: float = 0.7, max_tokens: Optional[int] = None
+        self,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get a response from the LLM.
@@ -179,6 +194,7 @@ class PromptStrategy(ABC):
         Args:
             temperature: Controls randomness in the output
             max_tokens: Maximum number of tokens to generate
+            stop: Sequences that end generation when emitted
 
         Returns:
             Raw LLM response
@@ -187,11 +203,42 @@ class PromptStrategy(ABC):
         logger.debug(f"Sending {len(messages)} messages to LLM")
 
         response = await self.llm_provider.generate(
-            messages=messages, temperature=temperature, max_tokens=max_tokens
+            messages=messages, temperature=temperature, max_tokens=max_tokens, stop=stop
         )
 
         return response
 
+    async def stream_llm_response(
+        self,
+        on_token: Callable[[str], None],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get a response from the LLM, passing each chunk to a callback as it arrives.
+
+        Args:
+            on_token: Called with every chunk of generated text
+            temperature: Controls randomness in the output
+            max_tokens: Maximum number of tokens to generate
+            stop: Sequences that end generation when emitted
+
+        Returns:
+            Response dictionary with the complete content
+        """
+        messages = self.get_messages_for_llm()
+        logger.debug(f"Streaming response for {len(messages)} messages")
+
+        chunks = []
+        async for chunk in self.llm_provider.generate_stream(
+            messages, temperature=temperature, max_tokens=max_tokens, stop=stop
+        ):
+            on_token(chunk)
+            chunks.append(chunk)
+
+        return {"content": "".join(chunks)}
+
     def clear_messages(self) -> None:
         """Clear all messages in the conversation."""
         self.messages = []
@@ -3,11 +3,13 @@ ReAct prompt strategy for the BMW Agents framework.
 This module implements the ReAct prompt strategy for iterative LLM calls with tool usage.
 """
 
+import asyncio
 import json
 import re
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from bmw_agents.core.prompt_strategies.base import Message, PromptStrategy
+from bmw_agents.utils import fast_json
 from bmw_agents.utils.llm_providers import LLMProvider
 from bmw_agents.utils.logger import get_logger
 
@@ -61,6 +63,7 @@ class ReActPromptStrategy(PromptStrategy):
         template_path: Optional[str] = None,
         max_iterations: int = 10,
         termination_sequence: str = "FINAL ANSWER:",
+        template_content: Optional[str] = None,
     ) -> None:
         """
         Initialize a ReAct prompt strategy.
@@ -71,12 +74,18 @@ class ReActPromptStrategy(PromptStrategy):
             template_path: Path to the template file. If not provided, a default template is used.
             max_iterations: Maximum number of iterations to run.
             termination_sequence: Sequence indicating the LLM has reached a final answer.
+            template_content: Template as a string, used instead of reading template_path.
         """
-        super().__init__(llm_provider, template_path=template_path)
+        super().__init__(
+            llm_provider, template_path=template_path, template_content=template_content
+        )
         self.tools = tools or []
         self.max_iterations = max_iterations
         self.termination_sequence = termination_sequence
 
+        # The framework supplies observations, so stop the model before it invents one
+        self.stop_sequences: List[str] = ["\nObservation:"]
+
         # Initialize execution trace
         self.thoughts: List[str] = []
         self.actions: List[Dict[str, Any]] = []
@@ -117,12 +126,19 @@ class ReActPromptStrategy(PromptStrategy):
                 return tool
         return None
 
-    async def execute(self, instruction: str, **kwargs: Any) -> str:
+    async def execute(
+        self,
+        instruction: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        **kwargs: Any,
+    ) -> str:
         """
         Execute the ReAct prompt strategy with the given instruction.
 
         Args:
             instruction: The instruction to execute.
+            on_token: Called with each chunk of model output as it is generated. When set,
+                responses are streamed instead of returned in one piece.
             **kwargs: Additional arguments.
 
         Returns:
@@ -158,10 +174,15 @@ class ReActPromptStrategy(PromptStrategy):
             logger.info(f"Starting iteration {iteration+1}/{self.max_iterations}")
 
             # Get LLM response
-            response = await self.get_llm_response(
-                temperature=kwargs.get("temperature", 0.7),
-                max_tokens=kwargs.get("max_tokens", None),
-            )
+            llm_params = {
+                "temperature": kwargs.get("temperature", 0.7),
+                "max_tokens": kwargs.get("max_tokens", None),
+                "stop": kwargs.get("stop", self.stop_sequences),
+            }
+            if on_token is not None:
+                response = await self.stream_llm_response(on_token, **llm_params)
+            else:
+                response = await self.get_llm_response(**llm_params)
 
             # Extract content
             content = response["content"]
@@ -250,7 +271,23 @@ class ReActPromptStrategy(PromptStrategy):
 
         # Try to parse action as JSON
         try:
-            # First, try to find a JSON object directly
+            # Several independent actions can be batched as {"actions": [...]}
+            if '"actions"' in action_str:
+                batch = self._parse_action_batch(action_str)
+                if batch is not None:
+                    return thought, batch
+
+            # First, try the first balanced object, which may have nested args
+            first_object = fast_json.first_object(action_str)
+            if first_object is not None:
+                try:
+                    action_json = json.loads(first_object)
+                    if isinstance(action_json, dict) and "tool" in action_json:
+                        return thought, action_json
+                except json.JSONDecodeError:
+                    pass
+
+            # Then look for flat JSON objects
             json_pattern = r"{[^{}]*}"
             json_matches = re.findall(json_pattern, action_str, re.DOTALL)
 
@@ -306,16 +343,47 @@ class ReActPromptStrategy(PromptStrategy):
 
         return thought, None
 
+    @staticmethod
+    def _parse_action_batch(action_str: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse an {"actions": [...]} batch of independent actions.
+
+        Args:
+            action_str: The text following the Action marker
+
+        Returns:
+            The batch with only the entries that name a tool, or None if it can't be parsed
+        """
+        # Only the first balanced object: text after it may contain braces of its own
+        batch_str = fast_json.first_object(action_str)
+        if batch_str is None:
+            return None
+        try:
+            batch = json.loads(batch_str)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(batch, dict) or not isinstance(batch.get("actions"), list):
+            return None
+        actions = [a for a in batch["actions"] if isinstance(a, dict) and "tool" in a]
+        return {"actions": actions} if actions else None
+
     async def execute_action(self, action: Dict[str, Any]) -> str:
         """
         Execute the specified action using the appropriate tool.
 
+        A batch of the form {"actions": [...]} runs its actions concurrently and
+        reports one numbered result per action, in order.
+
         Args:
             action: The action to execute, with 'tool' and 'args' keys
 
         Returns:
             The result of the action execution
         """
+        if "actions" in action:
+            results = await asyncio.gather(*(self.execute_action(a) for a in action["actions"]))
+            return "\n".join(f"Result {i}: {result}" for i, result in enumerate(results, 1))
+
         tool_name = action.get("tool")
         args = action.get("args", {})
 
@@ -3,7 +3,6 @@ Single-response TracedReAct prompt strategy for the BMW Agents framework.
 This module implements a version of TracedReAct that parses a complete execution trace from a single LLM response.
 """
 
-import json
 import os
 import re
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -11,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from bmw_agents.core.prompt_strategies.react import ReActPromptStrategy, Tool
 from bmw_agents.core.prompt_strategies.base import PromptStrategy
 from bmw_agents.core.toolbox.tool import BaseTool
+from bmw_agents.utils import fast_json
 from bmw_agents.utils.llm_providers import LLMProvider
 from bmw_agents.utils.logger import get_logger
 
@@ -46,6 +46,11 @@ class SingleResponseTracedReAct(PromptStrategy):
         self.tools = tools or []
         self.termination_sequence = termination_sequence
 
+        # With a single tool, actions that omit the "tool" key can only refer to it
+        self._implicit_tool_name: Optional[str] = (
+            self.tools[0].name if len(self.tools) == 1 else None
+        )
+
         # Initialize trace arrays
         self.thoughts: List[str] = []
         self.actions: List[Dict[str, Any]] = []
@@ -176,17 +181,18 @@ class SingleResponseTracedReAct(PromptStrategy):
         """
         # First, extract the final answer if present
         final_answer = ""
-        if self.termination_sequence in content:
-            final_parts = content.split(self.termination_sequence, 1)
-            if len(final_parts) > 1:
-                final_answer = final_parts[1].strip()
-                content = final_parts[
-                    0
-                ]  # Remove the final answer from the content for further processing
+        head, separator, tail = content.partition(self.termination_sequence)
+        if separator:
+            final_answer = tail.strip()
+            content = head  # Remove the final answer from the content for further processing
 
         # Store the final answer
         self.result = final_answer
 
+        # Termination-only responses carry no trace, so skip the regex pass entirely
+        if "thought:" not in content.lower():
+            return final_answer
+
         # Extract all thought-action-observation sequences
         pattern = r"(Thought:[\s\S]*?)(Action:[\s\S]*?)(Observation:[\s\S]*?)(?=Thought:|$)"
         sequences = re.finditer(pattern, content, re.IGNORECASE)
@@ -206,15 +212,15 @@ class SingleResponseTracedReAct(PromptStrategy):
             # Parse the action JSON
             action = None
             try:
-                # Try to extract JSON object
-                json_pattern = r"{.*}"
-                json_match = re.search(json_pattern, action_str, re.DOTALL)
-                if json_match:
-                    action_json = json.loads(json_match.group(0))
+                # Try to extract JSON object spanning the outermost braces
+                lo = action_str.find("{")
+                hi = action_str.rfind("}")
+                if lo >= 0 and hi > lo:
+                    action_json = fast_json.loads(action_str[lo : hi + 1])
 
                     # If we have action_json but no 'tool' key, see if we can infer it
-                    if "tool" not in action_json and len(self.tools) == 1:
-                        action_json["tool"] = self.tools[0].name
+                    if "tool" not in action_json and self._implicit_tool_name is not None:
+                        action_json["tool"] = self._implicit_tool_name
 
                     # If the action has a tool key, use it
                     if "tool" in action_json:
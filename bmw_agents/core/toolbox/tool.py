@@ -3,19 +3,96 @@ Tool module for the BMW Agents framework.
 This module defines the interface for tools that agents can use.
 """
 
+import functools
 import inspect
-from typing import Any, Callable, Dict, Optional, get_type_hints
+import re
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple, get_type_hints
 
 from bmw_agents.utils.logger import get_logger
 
 logger = get_logger("toolbox.tool")
 
+_EMPTY = inspect.Parameter.empty
+
+# A "Parameters:"/"Args:" section runs until the next line ending in a colon
+_PARAMS_BLOCK_RE = re.compile(
+    r"^[ \t]*(?:parameters|args):[^\n]*(?:\n|\Z)(.*?)(?=^[ \t]*\S[^\n]*:[ \t]*$|\Z)",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+# Each "name: description" line inside a parameters section
+_PARAM_LINE_RE = re.compile(r"^[ \t]*([^:\n]+?)[ \t]*:[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_param_info(function: Callable, docstring: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract parameter information from a function signature and docstring.
+
+    Results are cached per function and docstring, so tools rebuilt around the
+    same function skip the signature and type hint introspection.
+
+    Args:
+        function: The function to inspect
+        docstring: The cleaned docstring of the function
+
+    Returns:
+        Dictionary mapping parameter names to their type and description
+    """
+    params = {}
+    sig = inspect.signature(function)
+
+    # get_type_hints evaluates string annotations, so only pay for it when there are any
+    annotations = getattr(function, "__annotations__", None) or {}
+    if any(isinstance(hint, str) for hint in annotations.values()):
+        type_hints = get_type_hints(function)
+    else:
+        type_hints = annotations
+
+    param_descriptions = {}
+
+    # Most one-line or prose docstrings have no parameters section at all
+    lowered = docstring.lower()
+    if "parameters:" in lowered or "args:" in lowered:
+        for block in _PARAMS_BLOCK_RE.findall(docstring):
+            param_descriptions.update(_PARAM_LINE_RE.findall(block))
+
+    # Build parameter info dictionary
+    for name, param in sig.parameters.items():
+        # Skip 'self' parameter for methods
+        if name == "self":
+            continue
+
+        hint = type_hints.get(name, Any)
+        param_type = getattr(hint, "__name__", None) or repr(hint)
+        description = param_descriptions.get(name, f"Parameter '{name}'")
+
+        # Type names and short boilerplate descriptions repeat across tools
+        params[name] = {
+            "type": sys.intern(param_type),
+            "description": sys.intern(description) if len(description) < 64 else description,
+            "required": param.default is _EMPTY,
+        }
+
+    return params
+
 
 class BaseTool:
     """
     Base class for tools that can be used in the BMW Agents framework.
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "_function",
+        "_is_coro",
+        "_parameters",
+        "_schema",
+        "_formatted_parameters",
+        "_str_cache",
+    )
+
     def __init__(self, name: str, description: str, function: Callable) -> None:
         """
         Initialize a tool.
@@ -25,81 +102,89 @@ class BaseTool:
             description: A description of what the tool does
             function: The function that implements the tool's functionality
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.description = description
         self._function = function
+        self._is_coro = inspect.iscoroutinefunction(function)
 
-        # Extract parameter info from the function
-        self.parameters = self._get_parameter_info()
+        # Parameter info is extracted from the function on first access
+        self._parameters: Optional[Dict[str, Dict[str, Any]]] = None
 
-    def _get_parameter_info(self) -> Dict[str, Dict[str, Any]]:
+        # Prompt renderings built on first use and reused while the fields they mirror are unchanged
+        self._schema: Optional[Dict[str, Any]] = None
+        self._formatted_parameters: Optional[Tuple[Dict[str, Dict[str, Any]], str]] = None
+        self._str_cache: Optional[Tuple[str, str, Dict[str, Dict[str, Any]], str]] = None
+
+    @property
+    def parameters(self) -> Dict[str, Dict[str, Any]]:
+        """Parameter information for the tool, extracted from the function on first access."""
+        if self._parameters is None:
+            self._parameters = self._get_parameter_info()
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, parameters: Dict[str, Dict[str, Any]]) -> None:
+        self._parameters = parameters
+
+    def _get_parameter_info(self, docstring: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         Extract parameter information from the function.
 
+        Args:
+            docstring: Docstring to read parameter descriptions from, instead of the function's
+
         Returns:
             Dictionary mapping parameter names to their type and description
         """
-        params = {}
-        sig = inspect.signature(self._function)
-        type_hints = get_type_hints(self._function)
-
-        # Get docstring to extract parameter descriptions
-        docstring = inspect.getdoc(self._function) or ""
-        param_descriptions = {}
-
-        # Simple parsing of docstring to extract parameter descriptions
-        lines = docstring.split("\n")
-        in_params_section = False
-        current_param = None
-
-        for line in lines:
-            line = line.strip()
-
-            # Look for Parameters section
-            if line.lower().startswith("parameters:") or line.lower().startswith("args:"):
-                in_params_section = True
-                continue
-
-            # Exit parameters section when we hit another section
-            if in_params_section and line and line.endswith(":") and not line.startswith(" "):
-                in_params_section = False
-                continue
-
-            # Parse parameter descriptions
-            if in_params_section and line:
-                param_match = line.split(":", 1)
-                if len(param_match) == 2:
-                    current_param = param_match[0].strip()
-                    param_descriptions[current_param] = param_match[1].strip()
-                elif current_param and line.startswith(" "):
-                    # Continuation of previous parameter description
-                    param_descriptions[current_param] += " " + line.strip()
-
-        # Build parameter info dictionary
-        for name, param in sig.parameters.items():
-            # Skip 'self' parameter for methods
-            if name == "self":
-                continue
-
-            param_type = type_hints.get(name, Any).__name__
-            description = param_descriptions.get(name, f"Parameter '{name}'")
-
-            params[name] = {
-                "type": param_type,
-                "description": description,
-                "required": param.default == inspect.Parameter.empty,
-            }
+        if docstring is None:
+            docstring = inspect.getdoc(self._function) or ""
+        try:
+            cached = _extract_param_info(self._function, docstring)
+        except TypeError:
+            # Unhashable callables cannot be cached
+            cached = _extract_param_info.__wrapped__(self._function, docstring)
 
-        return params
+        # Hand out copies so callers can safely mutate the parameter info
+        return {name: info.copy() for name, info in cached.items()}
 
     def get_schema(self) -> Dict[str, Any]:
         """
         Get the JSON schema for the tool.
 
+        The returned dictionary is shared between calls and must not be mutated.
+
         Returns:
             Dictionary with tool name, description, and parameters
         """
-        return {"name": self.name, "description": self.description, "parameters": self.parameters}
+        schema = self._schema
+        if (
+            schema is None
+            or schema["name"] is not self.name
+            or schema["description"] is not self.description
+            or schema["parameters"] is not self.parameters
+        ):
+            schema = self._schema = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters,
+            }
+        return schema
+
+    def get_formatted_parameters(self) -> str:
+        """
+        Get the parameter list of the tool formatted for LLM prompts.
+
+        Returns:
+            One "  - name (required|optional): description" line per parameter
+        """
+        cached = self._formatted_parameters
+        if cached is None or cached[0] is not self.parameters:
+            lines = []
+            for param_name, param_info in self.parameters.items():
+                required = "required" if param_info.get("required", False) else "optional"
+                lines.append(f"  - {param_name} ({required}): {param_info.get('description', '')}")
+            cached = self._formatted_parameters = (self.parameters, "\n".join(lines))
+        return cached[1]
 
     async def execute(self, **kwargs: Any) -> Any:
         """
@@ -112,21 +197,29 @@ class BaseTool:
             The result of executing the tool
         """
         try:
-            if inspect.iscoroutinefunction(self._function):
+            if self._is_coro:
                 result = await self._function(**kwargs)
             else:
                 result = self._function(**kwargs)
             return result
         except Exception as e:
-            logger.error(f"Error executing tool {self.name}: {str(e)}")
+            logger.error("Error executing tool %s: %s", self.name, e)
             raise
 
     def __str__(self) -> str:
         """Get string representation of the tool."""
-        params_str = ", ".join(
-            [f"{name}: {info['type']}" for name, info in self.parameters.items()]
-        )
-        return f"{self.name}({params_str}): {self.description}"
+        cached = self._str_cache
+        parameters = self.parameters
+        if (
+            cached is None
+            or cached[0] is not self.name
+            or cached[1] is not self.description
+            or cached[2] is not parameters
+        ):
+            params_str = ", ".join([f"{name}: {info['type']}" for name, info in parameters.items()])
+            rendered = f"{self.name}({params_str}): {self.description}"
+            cached = self._str_cache = (self.name, self.description, parameters, rendered)
+        return cached[3]
 
 
 class Tool(BaseTool):
@@ -135,6 +228,8 @@ class Tool(BaseTool):
     Includes parameter information for use in LLM prompts.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -152,21 +247,8 @@ class Tool(BaseTool):
             parameters: Parameter information for the tool
         """
         super().__init__(name, description, function)
-        self.parameters = self._get_parameters(parameters)
-
-    def _get_parameters(self, parameters: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
-        """
-        Get parameters from provided dict or from function signature.
-        
-        Args:
-            parameters: Optionally provided parameters
-            
-        Returns:
-            Dictionary of parameter information
-        """
         if parameters is not None:
-            return parameters
-        return self._get_parameter_info()
+            self.parameters = parameters
 
 
 class SimpleTool(Tool):
@@ -177,6 +259,8 @@ class SimpleTool(Tool):
     with minimal configuration.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -193,7 +277,10 @@ class SimpleTool(Tool):
             function: The function to call when the tool is executed
             parameter_descriptions: Optional dictionary mapping parameter names to descriptions
         """
-        # Override docstring with provided parameter descriptions
+        super().__init__(name, description, function)
+
+        # Extract against a docstring carrying the provided descriptions; the function's own
+        # __doc__ is left alone since the same function may back other tools
         if parameter_descriptions:
             original_doc = function.__doc__ or ""
             params_doc = "Parameters:\n"
@@ -203,15 +290,13 @@ class SimpleTool(Tool):
             # Preserve original docstring if it exists, but replace or add parameters section
             if "Parameters:" in original_doc or "Args:" in original_doc:
                 # Replace existing parameters section
-                new_doc = original_doc.split("Parameters:")[0]
+                new_doc = original_doc.partition("Parameters:")[0].partition("Args:")[0]
                 new_doc += params_doc
             else:
                 # Add parameters section
                 new_doc = original_doc.strip() + "\n\n" + params_doc
 
-            function.__doc__ = new_doc
-
-        super().__init__(name, description, function)
+            self.parameters = self._get_parameter_info(inspect.cleandoc(new_doc))
 
 
 class FunctionTool(Tool):
@@ -220,6 +305,8 @@ class FunctionTool(Tool):
     This automatically extracts parameter information from the function signature.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, name: str, description: str, function: Callable, parameters: Dict[str, Dict[str, Any]]
     ) -> None:
@@ -232,5 +319,4 @@ class FunctionTool(Tool):
             function: The function that implements the tool's functionality
             parameters: Parameter information for the tool
         """
-        super().__init__(name, description, function)
-        self.parameters = parameters
+        super().__init__(name, description, function, parameters)
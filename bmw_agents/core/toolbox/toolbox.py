@@ -3,15 +3,30 @@ Toolbox module for the BMW Agents framework.
 This module defines the Toolbox class for managing collections of tools.
 """
 
+import functools
 import re
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from bmw_agents.core.toolbox.tool import Tool
+from bmw_agents.utils import fast_json
 from bmw_agents.utils.logger import get_logger
 
 logger = get_logger("toolbox.toolbox")
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a tool-name pattern, reusing earlier compilations of the same pattern."""
+    return re.compile(pattern)
+
+
+def _as_pattern(pattern: Union[str, "re.Pattern[str]"]) -> "re.Pattern[str]":
+    """Return the pattern unchanged if already compiled, otherwise compile it via the cache."""
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return _compile_pattern(pattern)
+
+
 class Toolbox:
     """
     Container for a collection of tools that can be used by agents.
@@ -29,11 +44,49 @@ class Toolbox:
         """
         self.tools: Dict[str, Tool] = {}
 
+        # Snapshot of self.tools.values(), rebuilt lazily after membership changes
+        self._tools_list_cache: Optional[List[Tool]] = None
+
+        # Serialized schema together with the per-tool schema dicts it was built from
+        self._schema_json_cache: Optional[Tuple[List[Dict[str, Any]], str]] = None
+
         # Add initial tools if provided
         if tools:
             for tool in tools:
                 self.add_tool(tool)
 
+    @classmethod
+    def from_tools(cls, tools: Iterable[Tool]) -> "Toolbox":
+        """
+        Create a toolbox from any iterable of tools in a single pass.
+
+        Unlike the constructor, this builds the name mapping in one dict comprehension
+        instead of registering tools one by one. Later tools replace earlier ones with
+        the same name.
+
+        Args:
+            tools: Tools to include
+
+        Returns:
+            New toolbox with the given tools
+        """
+        return cls._from_dict({tool.name: tool for tool in tools})
+
+    @classmethod
+    def _from_dict(cls, tools: Dict[str, Tool]) -> "Toolbox":
+        """
+        Create a toolbox that takes ownership of an already keyed tool dictionary.
+
+        Args:
+            tools: Mapping of tool names to tools
+
+        Returns:
+            New toolbox backed by the given dictionary
+        """
+        toolbox = cls()
+        toolbox.tools = tools
+        return toolbox
+
     def add_tool(self, tool: Tool) -> None:
         """
         Add a tool to the toolbox.
@@ -42,7 +95,8 @@ class Toolbox:
             tool: The tool to add
         """
         self.tools[tool.name] = tool
-        logger.debug(f"Added tool '{tool.name}' to toolbox")
+        self._tools_list_cache = None
+        logger.debug("Added tool '%s' to toolbox", tool.name)
 
     def remove_tool(self, tool_name: str) -> bool:
         """
@@ -56,10 +110,11 @@ class Toolbox:
         """
         if tool_name in self.tools:
             del self.tools[tool_name]
-            logger.debug(f"Removed tool '{tool_name}' from toolbox")
+            self._tools_list_cache = None
+            logger.debug("Removed tool '%s' from toolbox", tool_name)
             return True
         else:
-            logger.warning(f"Attempted to remove non-existent tool '{tool_name}'")
+            logger.warning("Attempted to remove non-existent tool '%s'", tool_name)
             return False
 
     def get_tool(self, tool_name: str) -> Optional[Tool]:
@@ -90,10 +145,14 @@ class Toolbox:
         """
         Get all tools in the toolbox.
 
+        The returned list is shared until the toolbox changes and must not be mutated.
+
         Returns:
             List of all tools
         """
-        return list(self.tools.values())
+        if self._tools_list_cache is None:
+            self._tools_list_cache = list(self.tools.values())
+        return self._tools_list_cache
 
     def get_tool_names(self) -> List[str]:
         """
@@ -113,6 +172,26 @@ class Toolbox:
         """
         return [tool.get_schema() for tool in self.tools.values()]
 
+    def get_schema_json(self) -> str:
+        """
+        Get the schema for all tools in the toolbox serialized as JSON.
+
+        The JSON text is reused for as long as every tool returns the same schema
+        object, so unchanged toolboxes are serialized only once.
+
+        Returns:
+            JSON array of tool schemas
+        """
+        schemas = self.get_schema()
+        cached = self._schema_json_cache
+        if (
+            cached is None
+            or len(cached[0]) != len(schemas)
+            or any(old is not new for old, new in zip(cached[0], schemas))
+        ):
+            cached = self._schema_json_cache = (schemas, fast_json.dumps(schemas))
+        return cached[1]
+
     def get_formatted_descriptions(self) -> str:
         """
         Get a formatted string with descriptions of all tools.
@@ -123,21 +202,11 @@ class Toolbox:
         if not self.tools:
             return "No tools available."
 
-        descriptions = []
+        entries = []
         for i, tool in enumerate(self.tools.values()):
-            param_desc = []
-            for param_name, param_info in tool.parameters.items():
-                required = "required" if param_info.get("required", False) else "optional"
-                param_desc.append(
-                    f"  - {param_name} ({required}): {param_info.get('description', '')}"
-                )
-
-            param_str = "\n".join(param_desc)
-            descriptions.append(
-                f"{i+1}. {tool.name}: {tool.description}\n" f"Parameters:\n{param_str}"
-            )
-
-        return "\n\n".join(descriptions)
+            parameters = tool.get_formatted_parameters()
+            entries.append(f"{i+1}. {tool.name}: {tool.description}\nParameters:\n{parameters}")
+        return "\n\n".join(entries)
 
     def filter_by_names(self, names: List[str]) -> "Toolbox":
         """
@@ -149,30 +218,28 @@ class Toolbox:
         Returns:
             New toolbox with the filtered tools
         """
-        filtered_tools = []
-        for name in names:
-            tool = self.get_tool(name)
-            if tool:
-                filtered_tools.append(tool)
-            else:
-                logger.warning(f"Tool '{name}' not found in toolbox")
+        tools = self.tools
+        filtered = {name: tools[name] for name in names if name in tools}
+
+        if len(filtered) < len(names):
+            for name in names:
+                if name not in tools:
+                    logger.warning("Tool '%s' not found in toolbox", name)
 
-        return Toolbox(filtered_tools)
+        return Toolbox._from_dict(filtered)
 
-    def filter_by_pattern(self, pattern: str) -> "Toolbox":
+    def filter_by_pattern(self, pattern: Union[str, "re.Pattern[str]"]) -> "Toolbox":
         """
         Create a new toolbox containing only the tools whose names match the pattern.
 
         Args:
-            pattern: Regex pattern to match against tool names
+            pattern: Regex pattern (string or pre-compiled) to match against tool names
 
         Returns:
             New toolbox with the filtered tools
         """
-        regex = re.compile(pattern)
-        filtered_tools = [tool for tool in self.tools.values() if regex.search(tool.name)]
-
-        return Toolbox(filtered_tools)
+        search = _as_pattern(pattern).search
+        return Toolbox.from_tools(tool for tool in self.tools.values() if search(tool.name))
 
     def merge(self, other: "Toolbox") -> "Toolbox":
         """
@@ -184,11 +251,8 @@ class Toolbox:
         Returns:
             New toolbox containing tools from both toolboxes
         """
-        merged = Toolbox(self.get_all_tools())
-        for tool in other.get_all_tools():
-            merged.add_tool(tool)
-
-        return merged
+        # Tools from the other toolbox win on name clashes, as with add_tool
+        return Toolbox._from_dict({**self.tools, **other.tools})
 
     def __len__(self) -> int:
         """Get the number of tools in the toolbox."""
@@ -200,4 +264,4 @@ class Toolbox:
 
     def __iter__(self) -> Iterator[Tool]:
         """Iterate over the tools in the toolbox."""
-        return iter(self.tools.values())
+        return iter(self.get_all_tools())
@@ -3,17 +3,51 @@ Toolbox Refiner module for the BMW Agents framework.
 This module defines the ToolboxRefiner class for customizing toolboxes for specific agents.
 """
 
+import copy
+import functools
 import re
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 from bmw_agents.core.toolbox.tool import SimpleTool, Tool
-from bmw_agents.core.toolbox.toolbox import Toolbox
+from bmw_agents.core.toolbox.toolbox import Toolbox, _as_pattern
 from bmw_agents.utils.logger import get_logger
 
 logger = get_logger("toolbox.toolbox_refiner")
 
 T = TypeVar("T")  # Type variable for return values
 
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal_prefix(regex: "re.Pattern[str]") -> Optional[str]:
+    """
+    Extract the literal text every match of an anchored pattern must start with.
+
+    Args:
+        regex: Compiled pattern to inspect
+
+    Returns:
+        The required literal prefix, or None if the pattern has none
+    """
+    source = regex.pattern
+    if (
+        not isinstance(source, str)
+        or not source.startswith("^")
+        or "|" in source
+        or regex.flags & (re.IGNORECASE | re.VERBOSE)
+    ):
+        return None
+
+    end = 1
+    while end < len(source) and source[end] not in _REGEX_META:
+        end += 1
+
+    # A quantifier makes the preceding character optional, so drop it from the prefix
+    if end < len(source) and source[end] in "*?{":
+        end -= 1
+
+    return source[1:end] or None
+
 
 class ToolboxRefiner:
     """
@@ -34,7 +68,7 @@ class ToolboxRefiner:
             base_toolbox: The base toolbox to refine
         """
         self.base_toolbox = base_toolbox
-        self.refined_toolbox = Toolbox(base_toolbox.get_all_tools())
+        self.refined_toolbox = Toolbox.from_tools(base_toolbox.get_all_tools())
 
     def include_tools(self, tool_names: List[str]) -> "ToolboxRefiner":
         """
@@ -64,12 +98,29 @@ class ToolboxRefiner:
                 self.refined_toolbox.remove_tool(name)
         return self
 
-    def include_pattern(self, pattern: str) -> "ToolboxRefiner":
+    @staticmethod
+    def compile_pattern(pattern: str) -> "re.Pattern[str]":
+        """
+        Compile a tool-name pattern for reuse across many refiners.
+
+        Agent factories that specialize toolboxes in a loop can hoist the
+        compilation out of the loop and pass the compiled pattern to
+        include_pattern/exclude_pattern.
+
+        Args:
+            pattern: Regex pattern to compile
+
+        Returns:
+            The compiled pattern
+        """
+        return re.compile(pattern)
+
+    def include_pattern(self, pattern: Union[str, "re.Pattern[str]"]) -> "ToolboxRefiner":
         """
         Include only tools whose names match the pattern.
 
         Args:
-            pattern: Regex pattern to match against tool names
+            pattern: Regex pattern (string or pre-compiled) to match against tool names
 
         Returns:
             Self for method chaining
@@ -77,20 +128,25 @@ class ToolboxRefiner:
         self.refined_toolbox = self.base_toolbox.filter_by_pattern(pattern)
         return self
 
-    def exclude_pattern(self, pattern: str) -> "ToolboxRefiner":
+    def exclude_pattern(self, pattern: Union[str, "re.Pattern[str]"]) -> "ToolboxRefiner":
         """
         Exclude tools whose names match the pattern.
 
         Args:
-            pattern: Regex pattern to match against tool names
+            pattern: Regex pattern (string or pre-compiled) to match against tool names
 
         Returns:
             Self for method chaining
         """
-        regex = re.compile(pattern)
-        tools_to_remove = [
-            tool.name for tool in self.refined_toolbox.get_all_tools() if regex.search(tool.name)
-        ]
+        regex = _as_pattern(pattern)
+        candidates = self.refined_toolbox.get_all_tools()
+
+        # Names without the pattern's literal prefix can never match, so skip the regex for them
+        prefix = _literal_prefix(regex)
+        if prefix is not None:
+            candidates = [tool for tool in candidates if tool.name.startswith(prefix)]
+
+        tools_to_remove = [tool.name for tool in candidates if regex.search(tool.name)]
 
         for name in tools_to_remove:
             self.refined_toolbox.remove_tool(name)
@@ -159,17 +215,16 @@ class ToolboxRefiner:
             logger.warning(f"Cannot specialize non-existent tool '{original_name}'")
             return self
 
-        # Create a wrapper function that applies fixed parameters
-        def specialized_function(*args: Any, **kwargs: Any) -> Any:
-            if fixed_params:
-                # Apply fixed parameters, but allow explicit parameters to override
-                for param_name, param_value in fixed_params.items():
-                    if param_name not in kwargs:
-                        kwargs[param_name] = param_value
-
-            return original_tool.execute(*args, **kwargs)
+        # Bind fixed parameters up front; explicit keyword arguments still override them.
+        # The partial wraps the coroutine execute(), so the new tool awaits it as well.
+        specialized_function: Callable[..., Any] = (
+            functools.partial(original_tool.execute, **fixed_params)
+            if fixed_params
+            else original_tool.execute
+        )
 
-        # Create a clone of the original parameters
+        # Build a new parameter mapping; entries are shared with the original tool unless
+        # their required flag changes, in which case that entry alone is copied
         parameters = {}
         for param_name, param_info in original_tool.parameters.items():
             # Skip parameters that are fixed and not required/optional
@@ -179,14 +234,17 @@ class ToolboxRefiner:
                 ):
                     continue
 
-            # Clone the parameter info
-            parameters[param_name] = param_info.copy()
-
             # Update required status based on required_params and optional_params
             if required_params and param_name in required_params:
-                parameters[param_name]["required"] = True
+                required = True
             elif optional_params and param_name in optional_params:
-                parameters[param_name]["required"] = False
+                required = False
+            else:
+                required = param_info.get("required")
+
+            if param_info.get("required") != required:
+                param_info = {**param_info, "required": required}
+            parameters[param_name] = param_info
 
         # Create the specialized tool
         specialized_tool = Tool(
@@ -212,14 +270,10 @@ class ToolboxRefiner:
         """
         tool = self.refined_toolbox.get_tool(tool_name)
         if tool:
-            # Create a new tool with the updated description
-            updated_tool = Tool(
-                name=tool.name,
-                description=new_description,
-                function=tool._function,
-                parameters=tool.parameters,
-            )
-            self.refined_toolbox.remove_tool(tool_name)
+            # Tools may be shared with the base toolbox, so update a shallow copy rather than
+            # the original; add_tool replaces the entry in place and keeps the tool order
+            updated_tool = copy.copy(tool)
+            updated_tool.description = new_description
             self.refined_toolbox.add_tool(updated_tool)
         return self
 
@@ -239,18 +293,13 @@ class ToolboxRefiner:
         """
         tool = self.refined_toolbox.get_tool(tool_name)
         if tool and param_name in tool.parameters:
-            # Create new parameters with the updated description
-            parameters = {k: v.copy() for k, v in tool.parameters.items()}
-            parameters[param_name]["description"] = new_description
-
-            # Create a new tool with the updated parameters
-            updated_tool = Tool(
-                name=tool.name,
-                description=tool.description,
-                parameters=parameters,
-                function=tool._function,
-            )
-            self.refined_toolbox.remove_tool(tool_name)
+            # Copy only the entry being changed; the others are shared with the original tool
+            parameters = dict(tool.parameters)
+            parameters[param_name] = {**parameters[param_name], "description": new_description}
+
+            # Swap the parameters on a shallow copy of the tool (see modify_tool_description)
+            updated_tool = copy.copy(tool)
+            updated_tool.parameters = parameters
             self.refined_toolbox.add_tool(updated_tool)
         return self
 
@@ -3,22 +3,76 @@ Basic tools module for the BMW Agents framework.
 This module provides basic built-in tools for common operations.
 """
 
+import asyncio
 import datetime
+import functools
 import json
 import math
 import os
 import random
 import re
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from bmw_agents.core.toolbox.tool import SimpleTool
+from bmw_agents.core.toolbox.tool import SimpleTool, Tool
 from bmw_agents.core.toolbox.toolbox import Toolbox
+from bmw_agents.utils import fast_json
 from bmw_agents.utils.logger import get_logger
 
+# aiohttp is only needed by the async web tools, so it is imported on first use
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = get_logger("toolbox.tools.basic_tools")
 
+
+@functools.lru_cache(maxsize=1024)
+def _compiled(pattern: str, engine: str = "re") -> Any:
+    """
+    Compile a regex pattern, reusing earlier compilations of the same pattern.
+
+    The "re2" engine compiles with google-re2, which matches in linear time regardless of
+    the input. It does not support lookarounds or backreferences, and its ``\\w``, ``\\d``
+    and ``$`` only match ASCII word characters, ASCII digits and the very end of the text.
+
+    Args:
+        pattern: Regular expression pattern
+        engine: "re" for the standard library, or "re2" for google-re2
+
+    Returns:
+        Compiled pattern object with ``sub``/``findall``/``search`` methods
+    """
+    if engine == "re":
+        return re.compile(pattern)
+    if engine != "re2":
+        raise ValueError(f"Unknown regex engine '{engine}'")
+
+    try:
+        import re2
+    except ImportError as e:
+        raise ImportError("engine='re2' requires google-re2") from e
+
+    options = re2.Options()
+    options.log_errors = False
+    try:
+        return re2.compile(pattern, options)
+    except re2.error as e:
+        raise ValueError(f"Pattern {pattern!r} is not supported by re2: {e}") from e
+
+
+@functools.lru_cache(maxsize=256)
+def _lower(substring: str) -> str:
+    """
+    Case-fold a search string, reusing the result for repeated inputs.
+
+    Only the short substring side of a search goes through this cache; the searched text
+    is folded on each call so whole documents are not kept alive.
+    """
+    return substring.casefold()
+
+
 # Text processing tools
 
 
@@ -65,7 +119,21 @@ def text_replace(text: str, old: str, new: str) -> str:
     return text.replace(old, new)
 
 
-def text_regex_replace(text: str, pattern: str, replacement: str) -> str:
+def text_translate(text: str, mapping: Dict[str, Optional[str]]) -> str:
+    """
+    Replace several single characters in one pass over the text.
+
+    Args:
+        text: The text to process
+        mapping: Map from single characters to their replacements (None deletes the character)
+
+    Returns:
+        Text with replacements
+    """
+    return text.translate(str.maketrans(mapping))
+
+
+def text_regex_replace(text: str, pattern: str, replacement: str, engine: str = "re") -> str:
     """
     Replace substrings matching a regex pattern in the text.
 
@@ -73,25 +141,27 @@ def text_regex_replace(text: str, pattern: str, replacement: str) -> str:
         text: The text to process
         pattern: Regular expression pattern
         replacement: The replacement string
+        engine: "re", or "re2" for linear-time matching (ASCII-only, no lookarounds/backrefs)
 
     Returns:
         Text with replacements
     """
-    return re.sub(pattern, replacement, text)
+    return _compiled(pattern, engine).sub(replacement, text)
 
 
-def text_extract(text: str, pattern: str) -> List[str]:
+def text_extract(text: str, pattern: str, engine: str = "re") -> List[str]:
     """
     Extract substrings matching a regex pattern from the text.
 
     Args:
         text: The text to process
         pattern: Regular expression pattern
+        engine: "re", or "re2" for linear-time matching (ASCII-only, no lookarounds/backrefs)
 
     Returns:
         List of matching substrings
     """
-    return re.findall(pattern, text)
+    return _compiled(pattern, engine).findall(text)
 
 
 def text_contains(text: str, substring: str, case_sensitive: bool = True) -> bool:
@@ -109,7 +179,26 @@ def text_contains(text: str, substring: str, case_sensitive: bool = True) -> boo
     if case_sensitive:
         return substring in text
     else:
-        return substring.lower() in text.lower()
+        return _lower(substring) in text.casefold()
+
+
+def text_contains_any(text: str, substrings: List[str], case_sensitive: bool = True) -> bool:
+    """
+    Check if text contains any of the given substrings.
+
+    Args:
+        text: The text to check
+        substrings: The substrings to look for
+        case_sensitive: Whether the search is case-sensitive
+
+    Returns:
+        True if at least one substring is found, False otherwise
+    """
+    if case_sensitive:
+        return any(substring in text for substring in substrings)
+
+    folded = text.casefold()
+    return any(_lower(substring) in folded for substring in substrings)
 
 
 # Math tools
@@ -202,9 +291,74 @@ def math_sqrt(number: float) -> float:
     return math.sqrt(number)
 
 
+#: Operations supported by math_elementwise and whether each takes a second operand
+_ELEMENTWISE_OPERATIONS: Final[Dict[str, bool]] = {
+    "add": True,
+    "subtract": True,
+    "multiply": True,
+    "divide": True,
+    "power": True,
+    "sqrt": False,
+}
+
+
+def math_elementwise(
+    operation: str, a: List[float], b: Optional[List[float]] = None
+) -> List[float]:
+    """
+    Apply a math operation to lists of numbers elementwise.
+
+    Args:
+        operation: One of add, subtract, multiply, divide, power or sqrt
+        a: First list of numbers
+        b: Second list of numbers, or a single-element list to apply to every element
+            (not used by sqrt)
+
+    Returns:
+        List of results
+    """
+    if operation not in _ELEMENTWISE_OPERATIONS:
+        raise ValueError(f"Unsupported operation: {operation}")
+    binary = _ELEMENTWISE_OPERATIONS[operation]
+    if binary and b is None:
+        raise ValueError(f"Operation '{operation}' needs a second list")
+
+    # NumPy is only needed here, so keep it out of the module import
+    import numpy as np
+
+    left = np.asarray(a, dtype=float)
+    if not binary:
+        if (left < 0).any():
+            raise ValueError("Cannot calculate square root of a negative number")
+        return np.sqrt(left).tolist()
+
+    right = np.asarray(b, dtype=float)
+    if operation == "divide" and not right.all():
+        raise ValueError("Cannot divide by zero")
+    return getattr(np, operation)(left, right).tolist()
+
+
 # Date and time tools
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime.datetime:
+    """Parse an ISO format timestamp, reusing earlier parses of the same string."""
+    return datetime.datetime.fromisoformat(timestamp)
+
+
+def _shift_datetime(
+    dt: datetime.datetime, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0
+) -> datetime.datetime:
+    """
+    Add a time duration to a datetime.
+
+    In-process code chaining date arithmetic can use this directly and skip the ISO
+    string round trip of the datetime tools.
+    """
+    return dt + datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+
+
 def datetime_now() -> str:
     """
     Get the current date and time.
@@ -226,7 +380,7 @@ def datetime_format(timestamp: str, format_str: str) -> str:
     Returns:
         Formatted date/time string
     """
-    dt = datetime.datetime.fromisoformat(timestamp)
+    dt = _parse_iso(timestamp)
     return dt.strftime(format_str)
 
 
@@ -246,28 +400,98 @@ def datetime_add(
     Returns:
         New timestamp in ISO format
     """
-    dt = datetime.datetime.fromisoformat(timestamp)
-    delta = datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
-    new_dt = dt + delta
-    return new_dt.isoformat()
+    dt = _parse_iso(timestamp)
+    return _shift_datetime(dt, days, hours, minutes, seconds).isoformat()
 
 
 # Web tools
 
+#: Default timeout in seconds for web requests
+DEFAULT_WEB_TIMEOUT = 30.0
+
+# Shared session so repeated requests to the same host reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+# aiohttp sessions are bound to an event loop, so the async session is created lazily per loop
+_ASYNC_SESSION: Optional["aiohttp.ClientSession"] = None
+_ASYNC_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
 
-def web_get(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+
+def _discard_async_session() -> None:
+    """
+    Drop the shared aiohttp session from outside its event loop.
+
+    If that loop is still running (in another thread), the session is closed on it.
+    Otherwise the session can no longer be closed and is left to the garbage collector;
+    call :func:`close_http_sessions` before the loop ends to shut it down cleanly.
+    """
+    global _ASYNC_SESSION, _ASYNC_SESSION_LOOP
+    session, loop = _ASYNC_SESSION, _ASYNC_SESSION_LOOP
+    _ASYNC_SESSION = _ASYNC_SESSION_LOOP = None
+    if session is None or session.closed:
+        return
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+
+def _get_async_session() -> "aiohttp.ClientSession":
+    """
+    Get the shared aiohttp session for the running event loop, creating it if needed.
+
+    A session left over from a previous event loop is dropped before it is replaced.
+
+    Returns:
+        Client session with a pooled connector
+    """
+    global _ASYNC_SESSION, _ASYNC_SESSION_LOOP
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    if _ASYNC_SESSION is None or _ASYNC_SESSION.closed or _ASYNC_SESSION_LOOP is not loop:
+        _discard_async_session()
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=50)
+        _ASYNC_SESSION = aiohttp.ClientSession(connector=connector)
+        _ASYNC_SESSION_LOOP = loop
+    return _ASYNC_SESSION
+
+
+async def close_http_sessions() -> None:
+    """
+    Close the shared aiohttp session used by the async web tools.
+
+    This is how the async web tools are shut down: call it before the event loop ends,
+    e.g. at the end of the coroutine passed to ``asyncio.run``. A session whose loop has
+    ended cannot be closed anymore and aiohttp reports its connections as unclosed.
+    Later async web requests open a new session.
+    """
+    global _ASYNC_SESSION, _ASYNC_SESSION_LOOP
+    if _ASYNC_SESSION_LOOP is not asyncio.get_running_loop():
+        _discard_async_session()
+        return
+    session = _ASYNC_SESSION
+    _ASYNC_SESSION = _ASYNC_SESSION_LOOP = None
+    if session is not None:
+        await session.close()
+
+
+def web_get(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: float = DEFAULT_WEB_TIMEOUT
+) -> str:
     """
     Make an HTTP GET request to a URL.
 
     Args:
         url: The URL to request
         headers: Optional headers for the request
+        timeout: Timeout in seconds for the request
 
     Returns:
         Response text
     """
     try:
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -275,7 +499,12 @@ def web_get(url: str, headers: Optional[Dict[str, str]] = None) -> str:
         raise
 
 
-def web_post(url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> str:
+def web_post(
+    url: str,
+    data: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = DEFAULT_WEB_TIMEOUT,
+) -> str:
     """
     Make an HTTP POST request to a URL.
 
@@ -283,6 +512,7 @@ def web_post(url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] =
         url: The URL to request
         data: The data to send (will be converted to JSON)
         headers: Optional headers for the request
+        timeout: Timeout in seconds for the request
 
     Returns:
         Response text
@@ -293,7 +523,7 @@ def web_post(url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] =
         if "Content-Type" not in headers:
             headers["Content-Type"] = "application/json"
 
-        response = requests.post(url, json=data, headers=headers)
+        response = _SESSION.post(url, json=data, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -301,8 +531,109 @@ def web_post(url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] =
         raise
 
 
+def web_get_stream(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    timeout: float = DEFAULT_WEB_TIMEOUT,
+) -> str:
+    """
+    Make an HTTP GET request to a URL, streaming the body in chunks.
+
+    Suited to large documents: the body is never held twice in memory, and downloads
+    larger than ``max_bytes`` are aborted early.
+
+    Args:
+        url: The URL to request
+        headers: Optional headers for the request
+        max_bytes: Maximum number of body bytes to accept
+        timeout: Timeout in seconds for the request
+
+    Returns:
+        Response text
+    """
+    try:
+        with _SESSION.get(url, headers=headers, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            buffer = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer += chunk
+                if len(buffer) > max_bytes:
+                    raise ValueError(f"Response from {url} exceeds {max_bytes} bytes")
+            return buffer.decode(response.encoding or "utf-8", errors="replace")
+    except Exception as e:
+        logger.error("Error making GET request to %s: %s", url, e)
+        raise
+
+
+async def web_get_async(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: float = DEFAULT_WEB_TIMEOUT
+) -> str:
+    """
+    Make a non-blocking HTTP GET request to a URL.
+
+    Concurrent calls share one pooled session, so many requests can be in flight at once.
+    Await :func:`close_http_sessions` before the event loop ends to close it.
+
+    Args:
+        url: The URL to request
+        headers: Optional headers for the request
+        timeout: Timeout in seconds for the request
+
+    Returns:
+        Response text
+    """
+    try:
+        import aiohttp
+
+        session = _get_async_session()
+        async with session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            return await response.text()
+    except Exception as e:
+        logger.error("Error making GET request to %s: %s", url, e)
+        raise
+
+
+async def web_post_async(
+    url: str,
+    data: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = DEFAULT_WEB_TIMEOUT,
+) -> str:
+    """
+    Make a non-blocking HTTP POST request to a URL.
+
+    Args:
+        url: The URL to request
+        data: The data to send (will be converted to JSON)
+        headers: Optional headers for the request
+        timeout: Timeout in seconds for the request
+
+    Returns:
+        Response text
+    """
+    try:
+        import aiohttp
+
+        session = _get_async_session()
+        async with session.post(
+            url, json=data, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            return await response.text()
+    except Exception as e:
+        logger.error("Error making POST request to %s: %s", url, e)
+        raise
+
+
 # JSON tools
 
+# Characters a JSON document can begin with, after leading whitespace
+_JSON_START_CHARS = frozenset('{["tfnNI-0123456789')
+
 
 def json_parse(text: str) -> Dict[str, Any]:
     """
@@ -314,9 +645,15 @@ def json_parse(text: str) -> Dict[str, Any]:
     Returns:
         Parsed Python object
     """
+    # Reject text that cannot start a JSON value before paying for a full parse attempt
+    stripped = text.lstrip(" \t\n\r")
+    if not stripped or stripped[0] not in _JSON_START_CHARS:
+        logger.debug("Rejected non-JSON input without parsing")
+        raise fast_json.JSONDecodeError("Expecting value", text, len(text) - len(stripped))
+
     try:
-        return json.loads(text)
-    except json.JSONDecodeError as e:
+        return fast_json.loads(text)
+    except fast_json.JSONDecodeError as e:
         logger.error(f"Error parsing JSON: {str(e)}")
         raise
 
@@ -325,6 +662,9 @@ def json_stringify(obj: Any, pretty: bool = False) -> str:
     """
     Convert a Python object to a JSON string.
 
+    The output matches ``json.dumps``: ", " and ": " separators, non-ASCII characters
+    escaped, and non-finite floats written as NaN/Infinity.
+
     Args:
         obj: Python object to convert
         pretty: Whether to format the JSON with indentation
@@ -372,10 +712,57 @@ def random_choice(options: List[Any]) -> Any:
     return random.choice(options)
 
 
+@functools.lru_cache(maxsize=None)
+def _rng() -> Any:
+    """NumPy generator for batched draws, created on first use to keep NumPy out of the import."""
+    import numpy as np
+
+    return np.random.default_rng()
+
+
+def random_numbers(count: int, min_value: float = 0, max_value: float = 1) -> List[float]:
+    """
+    Generate several random numbers in the specified range.
+
+    Args:
+        count: How many numbers to generate
+        min_value: Minimum value (inclusive)
+        max_value: Maximum value (exclusive)
+
+    Returns:
+        List of random numbers
+    """
+    return _rng().uniform(min_value, max_value, count).tolist()
+
+
+def random_choices(options: List[Any], count: int) -> List[Any]:
+    """
+    Choose several random items from a list, with replacement.
+
+    Args:
+        options: List of options to choose from
+        count: How many items to choose
+
+    Returns:
+        List of randomly selected items
+    """
+    if not options:
+        raise ValueError("Cannot choose from empty list")
+    return [options[i] for i in _rng().integers(0, len(options), count)]
+
+
+@functools.lru_cache(maxsize=256)
+def _env_cached(name: str) -> Optional[str]:
+    """Look up an environment variable, caching the result until env_refresh is called."""
+    return os.environ.get(name)
+
+
 def env_var(name: str, default: Optional[str] = None) -> str:
     """
     Get the value of an environment variable.
 
+    Values are cached on first read; call env_refresh after changing the environment.
+
     Args:
         name: Name of the environment variable
         default: Default value if the variable is not set
@@ -383,50 +770,83 @@ def env_var(name: str, default: Optional[str] = None) -> str:
     Returns:
         Value of the environment variable or default
     """
-    return os.environ.get(name, default)
+    value = _env_cached(name)
+    return default if value is None else value
 
 
-def create_basic_toolbox() -> Toolbox:
+def env_refresh() -> str:
     """
-    Create a toolbox with all basic tools.
+    Discard cached environment variable values so the next reads see the current environment.
 
     Returns:
-        Toolbox with basic tools
+        Confirmation message
     """
-    toolbox = Toolbox()
+    _env_cached.cache_clear()
+    return "Environment variable cache cleared"
+
 
+#: (name, function, description) for every basic tool, in registration order
+_BASIC_TOOL_SPECS: Final[Tuple[Tuple[str, Callable[..., Any], str], ...]] = (
     # Text processing tools
-    toolbox.add_tool(SimpleTool(name="text.split", function=text_split, description="Split text by delimiter"))
-    toolbox.add_tool(SimpleTool(name="text.join", function=text_join, description="Join text parts with delimiter"))
-    toolbox.add_tool(SimpleTool(name="text.replace", function=text_replace, description="Replace text in a string"))
-    toolbox.add_tool(SimpleTool(name="text.regex_replace", function=text_regex_replace, description="Replace text using regex pattern"))
-    toolbox.add_tool(SimpleTool(name="text.extract", function=text_extract, description="Extract text using a pattern"))
-    toolbox.add_tool(SimpleTool(name="text.contains", function=text_contains, description="Check if text contains substring"))
+    ("text.split", text_split, "Split text by delimiter"),
+    ("text.join", text_join, "Join text parts with delimiter"),
+    ("text.replace", text_replace, "Replace text in a string"),
+    ("text.translate", text_translate, "Replace several characters in one pass"),
+    ("text.regex_replace", text_regex_replace, "Replace text using regex pattern"),
+    ("text.extract", text_extract, "Extract text using a pattern"),
+    ("text.contains", text_contains, "Check if text contains substring"),
+    ("text.contains_any", text_contains_any, "Check if text contains any of the substrings"),
 
     # Math tools
-    toolbox.add_tool(SimpleTool(name="math.add", function=math_add, description="Add two numbers"))
-    toolbox.add_tool(SimpleTool(name="math.subtract", function=math_subtract, description="Subtract second number from first"))
-    toolbox.add_tool(SimpleTool(name="math.multiply", function=math_multiply, description="Multiply two numbers"))
-    toolbox.add_tool(SimpleTool(name="math.divide", function=math_divide, description="Divide first number by second"))
-    toolbox.add_tool(SimpleTool(name="math.power", function=math_power, description="Raise base to an exponent"))
-    toolbox.add_tool(SimpleTool(name="math.sqrt", function=math_sqrt, description="Calculate square root"))
+    ("math.add", math_add, "Add two numbers"),
+    ("math.subtract", math_subtract, "Subtract second number from first"),
+    ("math.multiply", math_multiply, "Multiply two numbers"),
+    ("math.divide", math_divide, "Divide first number by second"),
+    ("math.power", math_power, "Raise base to an exponent"),
+    ("math.sqrt", math_sqrt, "Calculate square root"),
+    ("math.elementwise", math_elementwise, "Apply a math operation to lists of numbers"),
 
     # Date and time tools
-    toolbox.add_tool(SimpleTool(name="datetime.now", function=datetime_now, description="Get current date and time"))
-    toolbox.add_tool(SimpleTool(name="datetime.format", function=datetime_format, description="Format date and time"))
-    toolbox.add_tool(SimpleTool(name="datetime.add", function=datetime_add, description="Add time to datetime"))
+    ("datetime.now", datetime_now, "Get current date and time"),
+    ("datetime.format", datetime_format, "Format date and time"),
+    ("datetime.add", datetime_add, "Add time to datetime"),
 
     # Web tools
-    toolbox.add_tool(SimpleTool(name="web.get", function=web_get, description="Make HTTP GET request"))
-    toolbox.add_tool(SimpleTool(name="web.post", function=web_post, description="Make HTTP POST request"))
+    ("web.get", web_get, "Make HTTP GET request"),
+    ("web.post", web_post, "Make HTTP POST request"),
+    ("web.get_stream", web_get_stream, "Make streaming HTTP GET request with a size cap"),
+    ("web.get_async", web_get_async, "Make non-blocking HTTP GET request"),
+    ("web.post_async", web_post_async, "Make non-blocking HTTP POST request"),
 
     # JSON tools
-    toolbox.add_tool(SimpleTool(name="json.parse", function=json_parse, description="Parse JSON string"))
-    toolbox.add_tool(SimpleTool(name="json.stringify", function=json_stringify, description="Convert object to JSON string"))
+    ("json.parse", json_parse, "Parse JSON string"),
+    ("json.stringify", json_stringify, "Convert object to JSON string"),
 
     # Utility tools
-    toolbox.add_tool(SimpleTool(name="random.number", function=random_number, description="Generate random number"))
-    toolbox.add_tool(SimpleTool(name="random.choice", function=random_choice, description="Pick random item from list"))
-    toolbox.add_tool(SimpleTool(name="env.get", function=env_var, description="Get environment variable"))
+    ("random.number", random_number, "Generate random number"),
+    ("random.choice", random_choice, "Pick random item from list"),
+    ("random.numbers", random_numbers, "Generate several random numbers"),
+    ("random.choices", random_choices, "Pick several random items from list"),
+    ("env.get", env_var, "Get environment variable"),
+    ("env.refresh", env_refresh, "Reload environment variables"),
+)
 
-    return toolbox
+
+# Built once at import; every basic toolbox shares these Tool objects
+_BASIC_TOOLS: Final[Dict[str, Tool]] = Toolbox.from_tools(
+    SimpleTool(name=name, function=function, description=description)
+    for name, function, description in _BASIC_TOOL_SPECS
+).tools
+
+
+def create_basic_toolbox() -> Toolbox:
+    """
+    Create a toolbox with all basic tools.
+
+    The tools are built once and shared between toolboxes; each call returns a new
+    Toolbox, so adding or removing tools does not affect other callers.
+
+    Returns:
+        Toolbox with basic tools
+    """
+    return Toolbox._from_dict(dict(_BASIC_TOOLS))
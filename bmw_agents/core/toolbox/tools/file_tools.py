@@ -3,20 +3,112 @@ File tools module for the BMW Agents framework.
 This module provides tools for file operations.
 """
 
+import atexit
+import codecs
 import csv
+import errno
+import fnmatch
+import functools
+import inspect
+import io
+import itertools
 import json
 import os
 import pathlib
+import re
 import shutil
-from typing import Any, Dict, List, Optional, Union
-
-from bmw_agents.core.toolbox.tool import SimpleTool
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from bmw_agents.core.toolbox.tool import SimpleTool, Tool
 from bmw_agents.core.toolbox.toolbox import Toolbox
+from bmw_agents.utils import fast_json
 from bmw_agents.utils.logger import get_logger
 
 logger = get_logger("toolbox.tools.file_tools")
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Buffer size for file tool I/O; larger than io.DEFAULT_BUFFER_SIZE to cut syscalls on big files
+_IO_BUFSIZE = 128 * 1024
+
+# Open append streams keyed by (absolute path, encoding), least recently used first
+_APPEND_CACHE_SIZE = 64
+_append_files: "OrderedDict[Tuple[str, str], TextIO]" = OrderedDict()
+_append_lock = threading.Lock()
+
+# Number of CSV rows formatted in memory between writes to the file
+_CSV_FLUSH_ROWS = 10000
+
+# Files up to this size are read with a single os.read call
+_SMALL_FILE_SIZE = 64 * 1024
+
+# copy_file_range errors that mean "use a regular copy instead"
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+)
+
+
+def _log_on_error(action: str) -> Callable[[F], F]:
+    """
+    Decorate a file tool so failures are logged before being re-raised.
+
+    The message is formatted lazily by the logging framework, so the success path costs a
+    single extra call and no string building.
+
+    Args:
+        action: Description of the operation, e.g. "reading file"
+
+    Returns:
+        Decorator for the tool function
+    """
+
+    def decorator(function: F) -> F:
+        # The first parameter is the path the operation acts on
+        target_name = next(iter(inspect.signature(function).parameters))
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return function(*args, **kwargs)
+            except Exception as e:
+                target = args[0] if args else kwargs.get(target_name)
+                logger.error("Error %s %s: %s", action, target, e)
+                raise
+
+        return cast(F, wrapper)
+
+    return decorator
+
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob pattern to a regex, reusing earlier compilations of the same pattern."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Check whether an encoding name refers to UTF-8."""
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+@_log_on_error("reading file")
 def file_read(path: str, encoding: str = "utf-8") -> str:
     """
     Read a text file.
@@ -28,14 +120,106 @@ def file_read(path: str, encoding: str = "utf-8") -> str:
     Returns:
         File contents as a string
     """
+    fd = os.open(path, os.O_RDONLY)
     try:
-        with open(path, "r", encoding=encoding) as f:
+        size = os.fstat(fd).st_size
+        # Small regular files are read without the buffered text layers.
+        # A zero size may be a pseudo-file (e.g. under /proc), so it takes the stream path.
+        if 0 < size <= _SMALL_FILE_SIZE:
+            # Read until EOF: os.read may return less than asked, and the file may have
+            # grown since the fstat
+            chunks = []
+            chunk = os.read(fd, size)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, _IO_BUFSIZE)
+            text = b"".join(chunks).decode(encoding)
+            # Match the universal newline handling of text mode
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return text
+
+        with os.fdopen(fd, "r", encoding=encoding, buffering=_IO_BUFSIZE) as f:
+            fd = -1  # Now owned by the file object
             return f.read()
-    except Exception as e:
-        logger.error(f"Error reading file {path}: {str(e)}")
-        raise
+    finally:
+        if fd >= 0:
+            os.close(fd)
+
 
+def file_read_many(paths: List[str], encoding: str = "utf-8", max_workers: int = 16) -> List[str]:
+    """
+    Read several text files concurrently.
 
+    Reads are issued from a thread pool so the storage device can serve them in parallel.
+
+    Args:
+        paths: Paths to the files
+        encoding: File encoding
+        max_workers: Maximum number of files read at the same time
+
+    Returns:
+        File contents, in the same order as the paths
+    """
+    if not paths:
+        return []
+
+    read = functools.partial(file_read, encoding=encoding)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(read, paths))
+
+
+def _append_text(path: str, content: str, encoding: str) -> None:
+    """
+    Append text to a file through a cached O_APPEND stream.
+
+    Streams stay open between calls so frequent appends skip open/close. A cached stream is
+    dropped when the path no longer refers to the file it has open (deleted or replaced).
+
+    Args:
+        path: Path to the file
+        content: Content to append
+        encoding: File encoding
+    """
+    key = (os.path.abspath(path), encoding)
+    with _append_lock:
+        f = _append_files.get(key)
+        if f is not None:
+            try:
+                current = os.stat(key[0])
+                opened = os.fstat(f.fileno())
+                reusable = (current.st_dev, current.st_ino) == (opened.st_dev, opened.st_ino)
+            except FileNotFoundError:
+                reusable = False
+            if reusable:
+                _append_files.move_to_end(key)
+            else:
+                del _append_files[key]
+                f.close()
+                f = None
+
+        if f is None:
+            fd = os.open(key[0], os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+            f = os.fdopen(fd, "a", encoding=encoding, buffering=_IO_BUFSIZE)
+            _append_files[key] = f
+            if len(_append_files) > _APPEND_CACHE_SIZE:
+                _, oldest = _append_files.popitem(last=False)
+                oldest.close()
+
+        f.write(content)
+        f.flush()
+
+
+@atexit.register
+def _close_append_files() -> None:
+    """Close all cached append streams."""
+    with _append_lock:
+        while _append_files:
+            _, f = _append_files.popitem()
+            f.close()
+
+
+@_log_on_error("writing to file")
 def file_write(path: str, content: str, encoding: str = "utf-8", append: bool = False) -> bool:
     """
     Write or append to a text file.
@@ -49,14 +233,13 @@ def file_write(path: str, content: str, encoding: str = "utf-8", append: bool =
     Returns:
         True if successful
     """
-    try:
-        mode = "a" if append else "w"
-        with open(path, mode, encoding=encoding) as f:
-            f.write(content)
+    if append:
+        _append_text(path, content, encoding)
         return True
-    except Exception as e:
-        logger.error(f"Error writing to file {path}: {str(e)}")
-        raise
+
+    with open(path, "w", encoding=encoding, buffering=_IO_BUFSIZE) as f:
+        f.write(content)
+    return True
 
 
 def file_exists(path: str) -> bool:
@@ -72,6 +255,7 @@ def file_exists(path: str) -> bool:
     return os.path.isfile(path)
 
 
+@_log_on_error("deleting file")
 def file_delete(path: str) -> bool:
     """
     Delete a file.
@@ -80,17 +264,17 @@ def file_delete(path: str) -> bool:
         path: Path to the file
 
     Returns:
-        True if successful
+        True if successful, False if there is no file at the path
     """
     try:
-        if not os.path.isfile(path):
-            logger.warning(f"File {path} does not exist")
-            return False
         os.remove(path)
-        return True
-    except Exception as e:
-        logger.error(f"Error deleting file {path}: {str(e)}")
-        raise
+    except FileNotFoundError:
+        logger.warning("File %s does not exist", path)
+        return False
+    except IsADirectoryError:
+        logger.warning("%s is a directory, not a file", path)
+        return False
+    return True
 
 
 def file_size(path: str) -> int:
@@ -103,13 +287,55 @@ def file_size(path: str) -> int:
     Returns:
         File size in bytes
     """
-    try:
-        return os.path.getsize(path)
-    except Exception as e:
-        logger.error(f"Error getting size of file {path}: {str(e)}")
-        raise
+    return os.path.getsize(path)
 
 
+def _copy_file_range(source: str, destination: str) -> bool:
+    """
+    Copy a file's data in the kernel with os.copy_file_range, then copy its metadata.
+
+    Args:
+        source: Path to the source file
+        destination: Path to the destination file (not a directory)
+
+    Returns:
+        True if the file was copied, False if copy_file_range is unavailable or unreliable for
+        these files and the caller should fall back to a regular copy
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        remaining = os.fstat(src_fd).st_size
+        # Pseudo-files (procfs, sysfs) report a zero size even when they have content
+        if remaining == 0:
+            return False
+        dst_fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    # Some filesystems (e.g. FUSE) return 0 before all data is copied
+                    return False
+                remaining -= copied
+        except OSError as e:
+            # Unsupported by the kernel or across these filesystems
+            if e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                return False
+            raise
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    shutil.copystat(source, destination)
+    return True
+
+
+@_log_on_error("copying file")
 def file_copy(source: str, destination: str) -> bool:
     """
     Copy a file.
@@ -121,14 +347,14 @@ def file_copy(source: str, destination: str) -> bool:
     Returns:
         True if successful
     """
-    try:
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    if not _copy_file_range(source, destination):
         shutil.copy2(source, destination)
-        return True
-    except Exception as e:
-        logger.error(f"Error copying file {source} to {destination}: {str(e)}")
-        raise
+    return True
 
 
+@_log_on_error("moving file")
 def file_move(source: str, destination: str) -> bool:
     """
     Move or rename a file.
@@ -140,14 +366,11 @@ def file_move(source: str, destination: str) -> bool:
     Returns:
         True if successful
     """
-    try:
-        shutil.move(source, destination)
-        return True
-    except Exception as e:
-        logger.error(f"Error moving file {source} to {destination}: {str(e)}")
-        raise
+    shutil.move(source, destination)
+    return True
 
 
+@_log_on_error("creating directory")
 def dir_create(path: str, exist_ok: bool = True) -> bool:
     """
     Create a directory.
@@ -159,12 +382,8 @@ def dir_create(path: str, exist_ok: bool = True) -> bool:
     Returns:
         True if successful
     """
-    try:
-        os.makedirs(path, exist_ok=exist_ok)
-        return True
-    except Exception as e:
-        logger.error(f"Error creating directory {path}: {str(e)}")
-        raise
+    os.makedirs(path, exist_ok=exist_ok)
+    return True
 
 
 def dir_exists(path: str) -> bool:
@@ -180,6 +399,7 @@ def dir_exists(path: str) -> bool:
     return os.path.isdir(path)
 
 
+@_log_on_error("listing directory")
 def dir_list(path: str, pattern: Optional[str] = None) -> List[str]:
     """
     List files and directories in a directory.
@@ -191,17 +411,53 @@ def dir_list(path: str, pattern: Optional[str] = None) -> List[str]:
     Returns:
         List of file and directory names
     """
-    try:
-        if pattern:
-            p = pathlib.Path(path)
-            return [str(item.relative_to(path)) for item in p.glob(pattern)]
-        else:
-            return os.listdir(path)
-    except Exception as e:
-        logger.error(f"Error listing directory {path}: {str(e)}")
-        raise
+    if not pattern:
+        return os.listdir(path)
+
+    if "/" not in pattern and os.sep not in pattern and "**" not in pattern:
+        # Single-level patterns only need entry names, so skip the Path objects
+        match = _compile_glob(pattern).match
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if match(entry.name)]
+
+    p = pathlib.Path(path)
+    return [str(item.relative_to(path)) for item in p.glob(pattern)]
+
 
+@_log_on_error("listing directory")
+def dir_list_detailed(path: str, pattern: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    List the entries of a directory together with their type and size.
+
+    The type comes from the directory listing itself, so only files need an extra stat
+    call for their size; prefer this over dir.list followed by per-entry checks.
 
+    Args:
+        path: Path to the directory
+        pattern: Optional glob pattern matched against entry names
+
+    Returns:
+        List of dictionaries with "name", "is_file", "is_dir" and "size" (None for non-files)
+    """
+    match = _compile_glob(pattern).match if pattern else None
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if match is not None and not match(entry.name):
+                continue
+            is_file = entry.is_file()
+            entries.append(
+                {
+                    "name": entry.name,
+                    "is_file": is_file,
+                    "is_dir": entry.is_dir(),
+                    "size": entry.stat().st_size if is_file else None,
+                }
+            )
+    return entries
+
+
+@_log_on_error("deleting directory")
 def dir_delete(path: str, recursive: bool = False) -> bool:
     """
     Delete a directory.
@@ -211,19 +467,20 @@ def dir_delete(path: str, recursive: bool = False) -> bool:
         recursive: Whether to delete the directory recursively
 
     Returns:
-        True if successful
+        True if successful, False if the directory does not exist
     """
     try:
         if recursive:
             shutil.rmtree(path)
         else:
             os.rmdir(path)
-        return True
-    except Exception as e:
-        logger.error(f"Error deleting directory {path}: {str(e)}")
-        raise
+    except FileNotFoundError:
+        logger.warning("Directory %s does not exist", path)
+        return False
+    return True
 
 
+@_log_on_error("reading JSON file")
 def json_read(path: str, encoding: str = "utf-8") -> Any:
     """
     Read and parse a JSON file.
@@ -235,14 +492,53 @@ def json_read(path: str, encoding: str = "utf-8") -> Any:
     Returns:
         Parsed JSON content
     """
+    with open(path, "rb", buffering=_IO_BUFSIZE) as f:
+        data = f.read()
+    # UTF-8 bytes can be handed to the parser without decoding them first
+    return fast_json.loads(data if _is_utf8(encoding) else data.decode(encoding))
+
+
+def json_iter_items(path: str, item_prefix: str = "item") -> Iterator[Any]:
+    """
+    Lazily yield the items of a JSON array without loading the whole file.
+
+    Requires the optional ijson package; only one item is held in memory at a time.
+
+    Args:
+        path: Path to the JSON file
+        item_prefix: ijson prefix of the items to yield ("item" for a top-level array)
+
+    Returns:
+        Iterator over the parsed items
+    """
     try:
-        with open(path, "r", encoding=encoding) as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error reading JSON file {path}: {str(e)}")
-        raise
+        import ijson
+    except ImportError as e:
+        raise ImportError("Streaming JSON reads require ijson") from e
+
+    with open(path, "rb", buffering=_IO_BUFSIZE) as f:
+        yield from ijson.items(f, item_prefix, use_float=True)
+
+
+@_log_on_error("streaming JSON file")
+def json_stream_read(
+    path: str, item_prefix: str = "item", limit: Optional[int] = None
+) -> List[Any]:
+    """
+    Read items from a large JSON array file incrementally.
+
+    Args:
+        path: Path to the JSON file
+        item_prefix: ijson prefix of the items to read ("item" for a top-level array)
+        limit: Maximum number of items to return (optional)
 
+    Returns:
+        List of parsed items
+    """
+    return list(itertools.islice(json_iter_items(path, item_prefix), limit))
 
+
+@_log_on_error("writing to JSON file")
 def json_write(path: str, data: Any, encoding: str = "utf-8", indent: int = 2) -> bool:
     """
     Write data to a JSON file.
@@ -256,17 +552,130 @@ def json_write(path: str, data: Any, encoding: str = "utf-8", indent: int = 2) -
     Returns:
         True if successful
     """
-    try:
-        with open(path, "w", encoding=encoding) as f:
+    if _is_utf8(encoding):
+        # Serialize in one call and write the whole document at once
+        with open(path, "w", encoding=encoding, buffering=_IO_BUFSIZE) as f:
+            f.write(fast_json.dumps(data, indent=indent))
+    else:
+        # Other encodings may not represent every character, so keep escaping non-ASCII
+        with open(path, "w", encoding=encoding, buffering=_IO_BUFSIZE) as f:
             json.dump(data, f, indent=indent)
-        return True
-    except Exception as e:
-        logger.error(f"Error writing to JSON file {path}: {str(e)}")
-        raise
+    return True
+
+
+@_log_on_error("saving state file")
+def state_save(path: str, data: Any) -> bool:
+    """
+    Save data to a compact binary MessagePack file.
+
+    Prefer state.save/state.load over the JSON tools for framework-internal state that is
+    only read back by this framework; use JSON for files shared with other programs.
+    Requires the optional msgpack package.
+
+    Args:
+        path: Path to the state file
+        data: Data to save (JSON-compatible types and bytes)
+
+    Returns:
+        True if successful
+    """
+    import msgpack
+
+    payload = msgpack.packb(data, use_bin_type=True)
+    with open(path, "wb", buffering=_IO_BUFSIZE) as f:
+        f.write(payload)
+    return True
+
 
+@_log_on_error("loading state file")
+def state_load(path: str) -> Any:
+    """
+    Load data saved with state_save.
+
+    Args:
+        path: Path to the state file
 
+    Returns:
+        The saved data
+    """
+    import msgpack
+
+    with open(path, "rb", buffering=_IO_BUFSIZE) as f:
+        return msgpack.unpackb(f.read(), raw=False)
+
+
+def _ragged_row_to_dict(header: Tuple[str, ...], row: List[str]) -> Dict[Any, Any]:
+    """
+    Map a CSV row whose length differs from the header the way csv.DictReader does.
+
+    Missing trailing fields are set to None and extra fields are collected under the key None.
+
+    Args:
+        header: Column names
+        row: Row values
+
+    Returns:
+        Row as a dictionary
+    """
+    result: Dict[Any, Any] = dict(zip(header, row))
+    if len(row) > len(header):
+        result[None] = row[len(header) :]
+    else:
+        for name in header[len(row) :]:
+            result[name] = None
+    return result
+
+
+def _csv_read_arrow(
+    path: str, has_header: bool, delimiter: str, encoding: str
+) -> List[Union[Dict[str, str], List[str]]]:
+    """
+    Read a CSV file with pyarrow's multithreaded parser.
+
+    All columns are read as strings so the result matches the stdlib reader.
+
+    Args:
+        path: Path to the CSV file
+        has_header: Whether the CSV file has a header row
+        delimiter: CSV delimiter
+        encoding: File encoding
+
+    Returns:
+        List of dictionaries (if has_header=True) or list of lists (if has_header=False)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError as e:
+        raise ImportError("csv_read with engine='arrow' requires pyarrow") from e
+
+    # Column names are needed up front to keep every column typed as a string
+    with open(path, "r", encoding=encoding, newline="") as f:
+        first_row = next(csv.reader(f, delimiter=delimiter), [])
+    if not first_row:
+        return []
+    names = first_row if has_header else [f"f{i}" for i in range(len(first_row))]
+
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(
+            encoding=encoding, autogenerate_column_names=not has_header
+        ),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(column_types={n: pa.string() for n in names}),
+    )
+    if has_header:
+        return table.to_pylist()
+    return [list(row) for row in zip(*(column.to_pylist() for column in table.columns))]
+
+
+@_log_on_error("reading CSV file")
 def csv_read(
-    path: str, has_header: bool = True, delimiter: str = ",", encoding: str = "utf-8"
+    path: str,
+    has_header: bool = True,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    engine: str = "python",
 ) -> List[Union[Dict[str, str], List[str]]]:
     """
     Read a CSV file.
@@ -276,24 +685,53 @@ def csv_read(
         has_header: Whether the CSV file has a header row
         delimiter: CSV delimiter
         encoding: File encoding
+        engine: "python" (csv module) or "arrow" for large files (needs pyarrow, same-length rows)
 
     Returns:
         List of dictionaries (if has_header=True) or list of lists (if has_header=False)
     """
-    try:
-        with open(path, "r", encoding=encoding, newline="") as f:
-            if has_header:
-                # We need to use Any type here to avoid mypy errors with csv.DictReader
-                reader: Any = csv.DictReader(f, delimiter=delimiter)
-                return [dict(row) for row in reader]  # Convert OrderedDict to dict
-            else:
-                reader = csv.reader(f, delimiter=delimiter)
-                return list(reader)
-    except Exception as e:
-        logger.error(f"Error reading CSV file {path}: {str(e)}")
-        raise
+    if engine == "arrow":
+        return _csv_read_arrow(path, has_header, delimiter, encoding)
+    if engine != "python":
+        raise ValueError(f"Unknown CSV engine '{engine}'")
+
+    with open(path, "r", encoding=encoding, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        if not has_header:
+            return list(reader)
 
+        # Zip rows onto the header directly instead of going through csv.DictReader;
+        # the header keys are interned since every row dict shares them
+        header = tuple(sys.intern(name) for name in next(reader, ()))
+        width = len(header)
+        return [
+            dict(zip(header, row)) if len(row) == width else _ragged_row_to_dict(header, row)
+            for row in reader
+            if row
+        ]
 
+
+def csv_read_fast(
+    path: str, has_header: bool = True, delimiter: str = ",", encoding: str = "utf-8"
+) -> List[Union[Dict[str, str], List[str]]]:
+    """
+    Read a large CSV file using pyarrow.
+
+    Args:
+        path: Path to the CSV file
+        has_header: Whether the CSV file has a header row
+        delimiter: CSV delimiter
+        encoding: File encoding
+
+    Returns:
+        List of dictionaries (if has_header=True) or list of lists (if has_header=False)
+    """
+    return csv_read(
+        path, has_header=has_header, delimiter=delimiter, encoding=encoding, engine="arrow"
+    )
+
+
+@_log_on_error("writing to CSV file")
 def csv_write(
     path: str,
     data: List[Union[Dict[str, str], List[str]]],
@@ -314,40 +752,47 @@ def csv_write(
     Returns:
         True if successful
     """
-    try:
-        with open(path, "w", encoding=encoding, newline="") as f:
-            # Check if data is a list of dictionaries or a list of lists
-            is_dict_list = bool(data) and all(isinstance(row, dict) for row in data)
-
-            if is_dict_list:
-                if not fieldnames and data:
-                    # Try to get fieldnames from the first dict
-                    dict_data = [d for d in data if isinstance(d, dict)]
-                    if dict_data:
-                        fieldnames = list(dict_data[0].keys())
-                
-                # We need to use Any type here to avoid mypy errors with csv.DictWriter
-                writer: Any = csv.DictWriter(f, fieldnames=fieldnames or [], delimiter=delimiter)
-                writer.writeheader()
-                
-                # Only write items that are dictionaries
-                dict_data = [d for d in data if isinstance(d, dict)]
-                writer.writerows(dict_data)
-            else:
-                writer = csv.writer(f, delimiter=delimiter)
-                
-                # Convert any dictionaries to lists of values
-                list_data = []
-                for row in data:
-                    if isinstance(row, dict):
-                        list_data.append(list(row.values()))
-                    else:
-                        list_data.append(row)
-                writer.writerows(list_data)
-        return True
-    except Exception as e:
-        logger.error(f"Error writing to CSV file {path}: {str(e)}")
-        raise
+    # Rows are formatted into an in-memory buffer and written to the file in large blocks
+    buffer = io.StringIO()
+
+    # Check if data is a list of dictionaries or a list of lists
+    is_dict_list = bool(data) and all(isinstance(row, dict) for row in data)
+
+    rows: List[Any]
+    if is_dict_list:
+        if not fieldnames:
+            # Take the fieldnames from the first dict
+            fieldnames = list(data[0].keys())
+
+        # We need to use Any type here to avoid mypy errors with csv.DictWriter
+        writer: Any = csv.DictWriter(buffer, fieldnames=fieldnames, delimiter=delimiter)
+        writer.writeheader()
+
+        # Every row is already known to be a dictionary
+        rows = data
+    else:
+        writer = csv.writer(buffer, delimiter=delimiter)
+
+        # Convert any dictionaries to lists of values
+        rows = [list(row.values()) if isinstance(row, dict) else row for row in data]
+
+    with open(path, "w", encoding=encoding, newline="", buffering=_IO_BUFSIZE) as f:
+        # Flush the buffer every _CSV_FLUSH_ROWS rows to bound its memory use
+        for start in range(0, len(rows), _CSV_FLUSH_ROWS):
+            writer.writerows(rows[start : start + _CSV_FLUSH_ROWS])
+            f.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        # Header of an empty dict list, if nothing was flushed above
+        f.write(buffer.getvalue())
+    return True
+
+
+# Bound once so the path tools skip the os.path attribute lookups on every call
+_path_join = os.path.join
+_path_abspath = os.path.abspath
+_path_basename = os.path.basename
+_path_dirname = os.path.dirname
 
 
 def path_join(*paths: str) -> str:
@@ -360,7 +805,7 @@ def path_join(*paths: str) -> str:
     Returns:
         Joined path
     """
-    return os.path.join(*paths)
+    return _path_join(*paths)
 
 
 def path_absolute(path: str) -> str:
@@ -373,7 +818,7 @@ def path_absolute(path: str) -> str:
     Returns:
         Absolute path
     """
-    return os.path.abspath(path)
+    return _path_abspath(path)
 
 
 def path_basename(path: str) -> str:
@@ -386,7 +831,7 @@ def path_basename(path: str) -> str:
     Returns:
         Basename of the path
     """
-    return os.path.basename(path)
+    return _path_basename(path)
 
 
 def path_dirname(path: str) -> str:
@@ -399,45 +844,64 @@ def path_dirname(path: str) -> str:
     Returns:
         Directory name of the path
     """
-    return os.path.dirname(path)
+    return _path_dirname(path)
 
 
-def create_file_toolbox() -> Toolbox:
-    """
-    Create a toolbox with file operation tools.
-
-    Returns:
-        Toolbox with file tools
-    """
-    toolbox = Toolbox()
-
+#: (name, function, description) for every file tool, in registration order
+_FILE_TOOL_SPECS: Final[Tuple[Tuple[str, Callable[..., Any], str], ...]] = (
     # File operations
-    toolbox.add_tool(SimpleTool(name="file.read", function=file_read, description="Read content from a file"))
-    toolbox.add_tool(SimpleTool(name="file.write", function=file_write, description="Write content to a file"))
-    toolbox.add_tool(SimpleTool(name="file.exists", function=file_exists, description="Check if a file exists"))
-    toolbox.add_tool(SimpleTool(name="file.delete", function=file_delete, description="Delete a file"))
-    toolbox.add_tool(SimpleTool(name="file.size", function=file_size, description="Get the size of a file"))
-    toolbox.add_tool(SimpleTool(name="file.copy", function=file_copy, description="Copy a file"))
-    toolbox.add_tool(SimpleTool(name="file.move", function=file_move, description="Move or rename a file"))
+    ("file.read", file_read, "Read content from a file"),
+    ("file.read_many", file_read_many, "Read several files concurrently"),
+    ("file.write", file_write, "Write content to a file"),
+    ("file.exists", file_exists, "Check if a file exists"),
+    ("file.delete", file_delete, "Delete a file"),
+    ("file.size", file_size, "Get the size of a file"),
+    ("file.copy", file_copy, "Copy a file"),
+    ("file.move", file_move, "Move or rename a file"),
 
     # Directory operations
-    toolbox.add_tool(SimpleTool(name="dir.create", function=dir_create, description="Create a directory"))
-    toolbox.add_tool(SimpleTool(name="dir.exists", function=dir_exists, description="Check if a directory exists"))
-    toolbox.add_tool(SimpleTool(name="dir.list", function=dir_list, description="List contents of a directory"))
-    toolbox.add_tool(SimpleTool(name="dir.delete", function=dir_delete, description="Delete a directory"))
+    ("dir.create", dir_create, "Create a directory"),
+    ("dir.exists", dir_exists, "Check if a directory exists"),
+    ("dir.list", dir_list, "List contents of a directory"),
+    ("dir.list_detailed", dir_list_detailed, "List directory entries with type and size"),
+    ("dir.delete", dir_delete, "Delete a directory"),
 
     # JSON operations
-    toolbox.add_tool(SimpleTool(name="json.read", function=json_read, description="Read and parse a JSON file"))
-    toolbox.add_tool(SimpleTool(name="json.write", function=json_write, description="Write data to a JSON file"))
+    ("json.read", json_read, "Read and parse a JSON file"),
+    ("json.stream_read", json_stream_read, "Read items from a large JSON array file"),
+    ("json.write", json_write, "Write data to a JSON file"),
+
+    # State operations
+    ("state.save", state_save, "Save data to a binary state file"),
+    ("state.load", state_load, "Load data from a binary state file"),
 
     # CSV operations
-    toolbox.add_tool(SimpleTool(name="csv.read", function=csv_read, description="Read a CSV file"))
-    toolbox.add_tool(SimpleTool(name="csv.write", function=csv_write, description="Write data to a CSV file"))
+    ("csv.read", csv_read, "Read a CSV file"),
+    ("csv.read_fast", csv_read_fast, "Read a large CSV file using pyarrow"),
+    ("csv.write", csv_write, "Write data to a CSV file"),
 
     # Path operations
-    toolbox.add_tool(SimpleTool(name="path.join", function=path_join, description="Join path components"))
-    toolbox.add_tool(SimpleTool(name="path.absolute", function=path_absolute, description="Get absolute path"))
-    toolbox.add_tool(SimpleTool(name="path.basename", function=path_basename, description="Get the base name of a path"))
-    toolbox.add_tool(SimpleTool(name="path.dirname", function=path_dirname, description="Get the directory name of a path"))
+    ("path.join", path_join, "Join path components"),
+    ("path.absolute", path_absolute, "Get absolute path"),
+    ("path.basename", path_basename, "Get the base name of a path"),
+    ("path.dirname", path_dirname, "Get the directory name of a path"),
+)
+
+# Built once at import; every file toolbox shares these Tool objects
+_FILE_TOOLS: Final[Dict[str, Tool]] = Toolbox.from_tools(
+    SimpleTool(name=name, function=function, description=description)
+    for name, function, description in _FILE_TOOL_SPECS
+).tools
+
+
+def create_file_toolbox() -> Toolbox:
+    """
+    Create a toolbox with file operation tools.
+
+    The tools are built once and shared between toolboxes; each call returns a new
+    Toolbox, so adding or removing tools does not affect other callers.
 
-    return toolbox
+    Returns:
+        Toolbox with file tools
+    """
+    return Toolbox._from_dict(dict(_FILE_TOOLS))
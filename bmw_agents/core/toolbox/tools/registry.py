@@ -3,6 +3,10 @@ Tool registry module for the BMW Agents framework.
 This module provides functions to get predefined toolboxes.
 """
 
+import functools
+from typing import Dict
+
+from bmw_agents.core.toolbox.tool import Tool
 from bmw_agents.core.toolbox.toolbox import Toolbox
 from bmw_agents.core.toolbox.tools.basic_tools import create_basic_toolbox
 from bmw_agents.core.toolbox.tools.file_tools import create_file_toolbox
@@ -11,24 +15,58 @@ from bmw_agents.utils.logger import get_logger
 logger = get_logger("toolbox.tools.registry")
 
 
-def get_all_tools() -> Toolbox:
+@functools.lru_cache(maxsize=None)
+def _cached_tools(kind: str) -> Dict[str, Tool]:
     """
-    Get a toolbox with all built-in tools.
+    Build the tool mapping for a predefined toolbox once per process.
+
+    Args:
+        kind: Which toolbox to build ("all" or "safe")
 
     Returns:
-        Toolbox with all built-in tools
+        Mapping of tool names to tools
     """
-    toolbox = Toolbox()
+    if kind == "all":
+        # Combine all toolboxes
+        toolbox = create_basic_toolbox().merge(create_file_toolbox())
+        logger.info("Created toolbox with %d tools", len(toolbox))
+    elif kind == "safe":
+        # Start with all basic tools
+        toolbox = create_basic_toolbox()
+
+        # Remove any potentially unsafe tools
+        unsafe_tools = [
+            "web.get",
+            "web.post",
+            "web.get_stream",
+            "web.get_async",
+            "web.post_async",
+        ]
+
+        for tool_name in unsafe_tools:
+            if tool_name in toolbox:
+                toolbox.remove_tool(tool_name)
+    else:
+        raise ValueError(f"Unknown toolbox kind '{kind}'")
+
+    return toolbox.tools
+
+
+def _invalidate_toolbox_cache() -> None:
+    """Discard the cached predefined toolboxes so the next call rebuilds them."""
+    _cached_tools.cache_clear()
 
-    # Merge in all toolboxes
-    basic_toolbox = create_basic_toolbox()
-    file_toolbox = create_file_toolbox()
 
-    # Combine all toolboxes
-    toolbox = basic_toolbox.merge(file_toolbox)
+def get_all_tools() -> Toolbox:
+    """
+    Get a toolbox with all built-in tools.
 
-    logger.info(f"Created toolbox with {len(toolbox)} tools")
-    return toolbox
+    The merged tool mapping is built once; each call returns a new Toolbox over it.
+
+    Returns:
+        Toolbox with all built-in tools
+    """
+    return Toolbox._from_dict(dict(_cached_tools("all")))
 
 
 def get_basic_tools() -> Toolbox:
@@ -58,14 +96,4 @@ def get_safe_tools() -> Toolbox:
     Returns:
         Toolbox with safe tools
     """
-    # Start with all basic tools
-    toolbox = create_basic_toolbox()
-
-    # Remove any potentially unsafe tools
-    unsafe_tools = ["web.get", "web.post"]
-
-    for tool_name in unsafe_tools:
-        if tool_name in toolbox:
-            toolbox.remove_tool(tool_name)
-
-    return toolbox
+    return Toolbox._from_dict(dict(_cached_tools("safe")))
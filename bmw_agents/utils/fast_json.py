@@ -0,0 +1,135 @@
+"""
+JSON helpers for the BMW Agents framework.
+Uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+
+import json
+import re
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+#: Exception raised by :func:`loads` on malformed input (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+# orjson parses integers outside the 64-bit range as floats; numbers with this many digits
+# are left to the standard library, which keeps them exact
+_LONG_NUMBER = re.compile(r"[0-9]{19}")
+_LONG_NUMBER_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    The result matches ``json.loads``: input orjson would parse differently (integers
+    wider than 64 bits) or rejects (``NaN``/``Infinity`` literals, overflowing floats)
+    goes through the standard library.
+
+    Args:
+        data: JSON text as str or bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        long_number = _LONG_NUMBER if isinstance(data, str) else _LONG_NUMBER_BYTES
+        if long_number.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Both backends emit compact separators and leave non-ASCII text unescaped, so this is
+    meant for internal serialization (cache keys, files written as UTF-8) rather than for
+    output that must match ``json.dumps``. orjson only indents by two spaces, so other
+    indents use the standard library. Non-finite floats are written as ``NaN``/``Infinity``
+    by both backends, as ``json.dumps`` does, rather than as orjson's ``null``.
+
+    Args:
+        obj: The object to serialize
+        indent: Number of spaces to indent by, or None for compact output
+        sort_keys: Whether to emit object keys in sorted order
+
+    Returns:
+        The JSON text
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson rejects some inputs the standard library accepts (e.g. non-str keys)
+            pass
+        else:
+            # orjson silently turns NaN and Infinity into null; only then is a second pass needed
+            if b"null" not in data:
+                return data.decode("utf-8")
+    if indent is None:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+    return json.dumps(obj, indent=indent, ensure_ascii=False, sort_keys=sort_keys)
+
+
+def object_end(text: str, start: int) -> int:
+    """
+    Find the end of the JSON object that opens at ``text[start]``.
+
+    Braces inside string literals are ignored, so trailing prose after the object (even
+    prose containing braces) does not affect the result.
+
+    Args:
+        text: Text containing the object
+        start: Index of the object's opening brace
+
+    Returns:
+        The index just past the closing brace, or -1 if the object is not closed
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+def first_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced ``{...}`` object in the text.
+
+    Args:
+        text: Text that may contain a JSON object among other content
+
+    Returns:
+        The object's source text, or None if there is no closed object
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    end = object_end(text, start)
+    return text[start:end] if end >= 0 else None
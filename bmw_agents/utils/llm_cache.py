@@ -0,0 +1,147 @@
+"""
+LLM response caching for the BMW Agents framework.
+Repeated requests with identical messages and sampling parameters can be served
+from a cache instead of calling the model again.
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from bmw_agents.utils import fast_json
+
+
+class CacheBackend(Protocol):
+    """Storage used by :class:`LLMCache`."""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored response for a key, or None if it is missing or expired."""
+        ...
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a response, optionally expiring after ``ttl`` seconds."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process cache backend with per-entry expiry and least-recently-used eviction."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of responses to keep
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored response for a key, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a response, evicting the least recently used one when full."""
+        expires = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        self._entries.clear()
+
+
+class LLMCache:
+    """
+    Exact-match cache of LLM responses.
+
+    Keys are SHA-256 digests of the model, sampling parameters and messages. Only requests
+    at or below ``max_temperature`` are cached, since sampled output is meant to vary.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = 3600.0,
+        max_temperature: float = 0.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Where responses are stored (default: an in-memory LRU)
+            ttl: Seconds a cached response stays valid (None to keep it until evicted)
+            max_temperature: Highest temperature for which responses are cached
+        """
+        self.backend: CacheBackend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.stats = {"hits": 0, "misses": 0}
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """Check whether requests at this temperature may be served from the cache."""
+        return temperature <= self.max_temperature
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        stop: Optional[List[str]] = None,
+    ) -> str:
+        """Build the cache key for a request."""
+        payload = fast_json.dumps(
+            {"m": model, "t": temperature, "mx": max_tokens, "s": stop, "msgs": messages},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from :meth:`make_key`
+
+        Returns:
+            A deep copy of the cached response, or None on a miss
+        """
+        response = self.backend.get(key)
+        if response is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        # Deep copies keep callers from mutating nested fields (e.g. usage) of the entry
+        return copy.deepcopy(response)
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from :meth:`make_key`
+            response: The provider response to cache
+        """
+        self.backend.set(key, copy.deepcopy(response), self.ttl)
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset the statistics."""
+        self.backend.clear()
+        self.stats = {"hits": 0, "misses": 0}
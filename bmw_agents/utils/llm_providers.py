@@ -3,15 +3,139 @@ LLM Provider interfaces for the BMW Agents framework.
 This module provides a uniform interface to interact with various LLM APIs.
 """
 
+import asyncio
+import functools
+import importlib.util
 import logging
 import os
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
-import ollama
-import openai
-from anthropic import Anthropic
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+from bmw_agents.utils.llm_cache import LLMCache
+from bmw_agents.utils.logger import get_logger
+
+# The provider SDKs are slow to import, so each one is imported by the provider that needs it
+if TYPE_CHECKING:
+    import ollama
+    import openai
+    from anthropic import Anthropic, AsyncAnthropic
+
+logger = get_logger("llm_providers")
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether a failed LLM request is worth retrying.
+
+    Connection problems, timeouts, rate limits (429) and server errors (5xx) are transient;
+    authentication failures, bad requests and unknown models will fail the same way again.
+    """
+    connection_errors: List[type] = [ConnectionError]
+    # An exception can only come from an SDK that has been imported
+    for module_name, error_name in (
+        ("openai", "APIConnectionError"),
+        ("anthropic", "APIConnectionError"),
+        ("httpx", "TransportError"),
+    ):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            connection_errors.append(getattr(module, error_name))
+    if isinstance(exc, tuple(connection_errors)):
+        return True
+    status_code = getattr(exc, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+# Retry policy shared by the providers' generate methods
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient_error),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    reraise=True,
+)
+
+# Keep-alive pool settings (httpx.Limits arguments) for the HTTP clients this module creates
+_HTTP_LIMITS: Dict[str, Any] = {
+    "max_connections": 64,
+    "max_keepalive_connections": 32,
+    "keepalive_expiry": 300.0,
+}
+# HTTP/2 needs the optional h2 package; without it httpx stays on HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_openai_client(api_key: str) -> "openai.OpenAI":
+    """
+    Return the shared OpenAI client for an API key.
+
+    Providers share it so consecutive requests reuse its keep-alive connection pool
+    instead of each instance opening its own connections.
+    """
+    import openai
+
+    return openai.OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_anthropic_client(api_key: str) -> "Anthropic":
+    """Return the shared Anthropic client for an API key."""
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model_name: str) -> Any:
+    """
+    Return the tiktoken encoding for a model, building it only once.
+
+    Models tiktoken doesn't know (e.g. new dated variants) fall back to cl100k_base.
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        logger.debug("No tiktoken encoding for model %s, using cl100k_base", model_name)
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_model_tokens(model_name: str, text: str) -> int:
+    """Count tokens for a model, memoized so repeated prompts are not re-encoded."""
+    # Special-token text in prompts is counted as plain text instead of raising
+    return len(_get_encoding(model_name).encode(text, disallowed_special=()))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cl100k() -> Any:
+    """Return the cl100k_base encoding, or None if tiktoken or its data is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("cl100k_base tokenizer unavailable, falling back to length estimate: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _estimate_tokens(text: str) -> int:
+    """
+    Approximate the token count of text for models without a public tokenizer.
+
+    cl100k_base tracks most modern BPE vocabularies far more closely than a characters-per-token
+    ratio, especially for code, JSON and non-Latin scripts.
+    """
+    encoding = _get_cl100k()
+    if encoding is None:
+        # Simple approximation: ~4 characters per token
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
 
 
 class LLMProvider(ABC):
@@ -26,6 +150,7 @@ class LLMProvider(ABC):
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Generate a response from the LLM based on the provided messages.
@@ -34,12 +159,73 @@ class LLMProvider(ABC):
             messages: List of message dictionaries with 'role' and 'content' keys
             temperature: Controls randomness of the output
             max_tokens: Maximum number of tokens to generate
+            stop: Sequences that end generation when emitted (not included in the output)
 
         Returns:
             Dictionary with response content and metadata
         """
         pass
 
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the LLM as it is generated.
+
+        Providers without native streaming yield the complete response as a single chunk.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys
+            temperature: Controls randomness of the output
+            max_tokens: Maximum number of tokens to generate
+            stop: Sequences that end generation when emitted (not included in the output)
+
+        Yields:
+            Successive pieces of the response content
+        """
+        response = await self.generate(messages, temperature, max_tokens, stop)
+        yield response["content"]
+
+    async def generate_many(
+        self,
+        batch: List[List[Dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate responses for several independent conversations concurrently.
+
+        Args:
+            batch: List of message lists, one per conversation
+            temperature: Controls randomness of the output
+            max_tokens: Maximum number of tokens to generate per response
+            max_concurrency: Maximum number of requests in flight (None for no limit)
+            stop: Sequences that end generation when emitted (not included in the output)
+
+        Returns:
+            List of response dictionaries in the same order as ``batch``
+        """
+        if not max_concurrency:
+            return list(
+                await asyncio.gather(
+                    *[self.generate(messages, temperature, max_tokens, stop) for messages in batch]
+                )
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate(messages, temperature, max_tokens, stop)
+
+        return list(await asyncio.gather(*[generate_one(messages) for messages in batch]))
+
     @abstractmethod
     def count_tokens(self, text: str) -> int:
         """
@@ -67,22 +253,25 @@ class OpenAIProvider(LLMProvider):
         """
         self.model_name = model_name
         if api_key:
-            openai.api_key = api_key
+            self.api_key = api_key
         elif os.environ.get("OPENAI_API_KEY"):
-            openai.api_key = os.environ.get("OPENAI_API_KEY")
+            self.api_key = os.environ.get("OPENAI_API_KEY")
         else:
             raise ValueError(
                 "OpenAI API key must be provided or set as OPENAI_API_KEY environment variable"
             )
 
-        self.client = openai.OpenAI()
+        self.client = _get_openai_client(self.api_key)
+        self._async_client: Optional["openai.AsyncOpenAI"] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @_retry_transient
     async def generate(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Generate a response using the OpenAI API."""
         try:
@@ -91,6 +280,7 @@ class OpenAIProvider(LLMProvider):
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                stop=stop,
             )
 
             return {
@@ -104,15 +294,43 @@ class OpenAIProvider(LLMProvider):
                 },
             }
         except Exception as e:
-            logging.error(f"Error calling OpenAI API: {str(e)}")
+            logger.error("Error calling OpenAI API: %s", e)
+            raise
+
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response from the OpenAI API."""
+        # Async clients are bound to an event loop, so make a new one for each loop
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            import openai
+
+            self._async_client = openai.AsyncOpenAI(api_key=self.api_key)
+            self._async_client_loop = loop
+        try:
+            stream = await self._async_client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stop=stop,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error("Error streaming from OpenAI API: %s", e)
             raise
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using OpenAI's tiktoken."""
-        import tiktoken
-
-        encoding = tiktoken.encoding_for_model(self.model_name)
-        return len(encoding.encode(text))
+        return _count_model_tokens(self.model_name, text)
 
 
 class AnthropicProvider(LLMProvider):
@@ -138,25 +356,22 @@ class AnthropicProvider(LLMProvider):
                 "Anthropic API key must be provided or set as ANTHROPIC_API_KEY environment variable"
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = _get_anthropic_client(self.api_key)
+        self._async_client: Optional["AsyncAnthropic"] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @_retry_transient
     async def generate(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Generate a response using the Anthropic API."""
         try:
-            # Convert messages to Anthropic format if needed
-            anthropic_messages = messages
-
             response = self.client.messages.create(
-                model=self.model_name,
-                messages=anthropic_messages,
-                temperature=temperature,
-                max_tokens=max_tokens or 1024,
+                **self._request_params(messages, temperature, max_tokens, stop)
             )
 
             return {
@@ -168,102 +383,269 @@ class AnthropicProvider(LLMProvider):
                 },
             }
         except Exception as e:
-            logging.error(f"Error calling Anthropic API: {str(e)}")
+            logger.error("Error calling Anthropic API: %s", e)
             raise
 
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response from the Anthropic API."""
+        # Async clients are bound to an event loop, so make a new one for each loop
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from anthropic import AsyncAnthropic
+
+            self._async_client = AsyncAnthropic(api_key=self.api_key)
+            self._async_client_loop = loop
+        try:
+            async with self._async_client.messages.stream(
+                **self._request_params(messages, temperature, max_tokens, stop)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            logger.error("Error streaming from Anthropic API: %s", e)
+            raise
+
+    def _request_params(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        stop: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the Messages API parameters for a conversation.
+
+        The API takes system prompts as a separate ``system`` parameter rather than as
+        messages. The system prompt holds the static instructions and tool descriptions,
+        so its last block is marked with ``cache_control`` and later calls reuse the
+        cached prefix.
+        """
+        system = [
+            {"type": "text", "text": m["content"]} for m in messages if m["role"] == "system"
+        ]
+        params: Dict[str, Any] = {
+            "model": self.model_name,
+            "messages": [m for m in messages if m["role"] != "system"],
+            "temperature": temperature,
+            "max_tokens": max_tokens or 1024,
+        }
+        if stop:
+            params["stop_sequences"] = stop
+        if system:
+            system[-1]["cache_control"] = {"type": "ephemeral"}
+            params["system"] = system
+        return params
+
     def count_tokens(self, text: str) -> int:
         """
         Approximate token count for Anthropic models.
-        This is a rough approximation as Anthropic doesn't provide a public tokenizer.
+        This is an approximation as Anthropic doesn't provide a public tokenizer.
         """
-        # Crude approximation: ~4 characters per token
-        return len(text) // 4
+        return _estimate_tokens(text)
 
 
 class OllamaProvider(LLMProvider):
     """LLM provider for Ollama models."""
 
-    def __init__(self, model_name: str = "deepseek-r1:14b", host: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model_name: str = "deepseek-r1:14b",
+        host: Optional[str] = None,
+        keep_alive: Optional[str] = "30m",
+        cache: Optional[LLMCache] = None,
+        num_ctx: Optional[int] = None,
+    ) -> None:
         """
         Initialize the Ollama provider.
 
         Args:
             model_name: The name of the Ollama model to use
             host: Ollama host address (default: http://localhost:11434)
+            keep_alive: How long Ollama keeps the model and its prompt cache loaded
+                between requests (None uses the server default)
+            cache: Response cache for repeated requests (default: no caching)
+            num_ctx: Context window size in tokens (None uses the model default). Set it
+                large enough for a whole conversation: when the history overflows, Ollama
+                drops its oldest tokens and can no longer reuse the cached prompt prefix
         """
         self.model_name = model_name
+        self.keep_alive = keep_alive
+        self.cache = cache
+        self.num_ctx = num_ctx
         self.host = host or os.environ.get("OLLAMA_HOST", "http://localhost:11434")
 
-        # Initialize client with host if provided
-        if self.host and self.host != "http://localhost:11434":
-            ollama.set_host(self.host)
+        # Async client with a persistent connection pool, created per event loop (see _get_client)
+        self._client: Optional["ollama.AsyncClient"] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
-        logging.info(f"Initialized Ollama provider with model: {model_name}, host: {self.host}")
+        logger.info("Initialized Ollama provider with model: %s, host: %s", model_name, self.host)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @_retry_transient
     async def generate(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Generate a response using Ollama."""
+        key = None
+        if self.cache is not None and self.cache.is_cacheable(temperature):
+            key = self.cache.make_key(self.model_name, messages, temperature, max_tokens, stop)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
             # Log the input messages (list only first few for brevity)
-            msg_preview = []
-            for m in messages[:3]:  # Only show up to 3 messages
-                msg_preview.append({"role": m["role"], "content": m["content"][:100] + "..."})
-            logging.debug(f"Sending messages to Ollama: {msg_preview}")
-
-            # Set options for generation
-            options = {
-                "temperature": temperature,
-            }
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sending messages to Ollama: %s",
+                    [
+                        {"role": m["role"], "content": m["content"][:100] + "..."}
+                        for m in messages[:3]  # Only show up to 3 messages
+                    ],
+                )
 
-            # Add max tokens if provided
-            if max_tokens:
-                options["num_predict"] = max_tokens
+            options = self._chat_options(temperature, max_tokens, stop)
 
             # Make the API call
-            response = ollama.chat(model=self.model_name, messages=messages, options=options)
-
-            # Log the raw response for debugging (in a safer way)
-            self._log_debug_response(response)
+            response = await self._get_client().chat(
+                model=self.model_name,
+                messages=messages,
+                options=options,
+                keep_alive=self.keep_alive,
+            )
 
-            # Extract the content from the response
-            content = response["message"]["content"]
+            result = self._build_response(messages, response)
+        except Exception as e:
+            logger.error("Error calling Ollama API: %s", e)
+            raise
 
-            # Log the extracted content
-            logging.debug(f"Extracted content: {content[:200]}...")
+        if key is not None:
+            self.cache.set(key, result)
+        return result
 
-            # Structure the response in a consistent format
-            return {
-                "content": content,
-                "model": self.model_name,
-                "finish_reason": "stop",  # Ollama doesn't provide finish reason
-                "usage": {
-                    # Ollama doesn't provide token counts directly
-                    "prompt_tokens": self._estimate_token_count(
-                        " ".join([m["content"] for m in messages])
-                    ),
-                    "completion_tokens": self._estimate_token_count(content),
-                    "total_tokens": 0,  # Will be calculated below
-                },
-            }
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response from Ollama."""
+        options = self._chat_options(temperature, max_tokens, stop)
+        try:
+            stream = await self._get_client().chat(
+                model=self.model_name,
+                messages=messages,
+                options=options,
+                stream=True,
+                keep_alive=self.keep_alive,
+            )
+            async for part in stream:
+                content = part["message"]["content"]
+                if content:
+                    yield content
         except Exception as e:
-            logging.error(f"Error calling Ollama API: {str(e)}")
+            logger.error("Error streaming from Ollama API: %s", e)
             raise
 
+    async def __aenter__(self) -> "OllamaProvider":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is None:
+            return
+        close = getattr(client, "close", None)
+        if close is not None:
+            await close()
+        else:  # older ollama clients only expose the wrapped httpx client
+            await client._client.aclose()
+
+    def _get_client(self) -> "ollama.AsyncClient":
+        """
+        Return the async client for the running event loop.
+
+        An httpx connection pool is bound to the loop that first used it, and providers are
+        shared through get_llm_provider, so a client is created for each new event loop
+        (e.g. successive asyncio.run calls). The previous loop is already gone by then, so
+        its client is dropped rather than closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            import httpx
+            import ollama
+
+            self._client = ollama.AsyncClient(
+                host=self.host, limits=httpx.Limits(**_HTTP_LIMITS), http2=_HTTP2
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _chat_options(
+        self, temperature: float, max_tokens: Optional[int], stop: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the Ollama generation options."""
+        options: Dict[str, Any] = {
+            "temperature": temperature,
+        }
+
+        # Add max tokens if provided
+        if max_tokens:
+            options["num_predict"] = max_tokens
+        if stop:
+            options["stop"] = stop
+
+        # Keep the window fixed across calls; changing it makes Ollama reload the model
+        if self.num_ctx:
+            options["num_ctx"] = self.num_ctx
+        return options
+
+    def _build_response(self, messages: List[Dict[str, str]], response: Any) -> Dict[str, Any]:
+        """Convert a raw Ollama chat response into the provider response format."""
+        # Extract the content from the response
+        content = response["message"]["content"]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log the raw response for debugging (in a safer way)
+            self._log_debug_response(response)
+            logger.debug("Extracted content: %s...", content[:200])
+
+        # Structure the response in a consistent format
+        return {
+            "content": content,
+            "model": self.model_name,
+            "finish_reason": "stop",  # Ollama doesn't provide finish reason
+            "usage": {
+                # Ollama doesn't provide token counts directly
+                # Per-message estimates are memoized, so only new messages are tokenized
+                "prompt_tokens": sum(self._estimate_token_count(m["content"]) for m in messages),
+                "completion_tokens": self._estimate_token_count(content),
+                "total_tokens": 0,  # Will be calculated below
+            },
+        }
+
     def _log_debug_response(self, response: Any) -> None:
         """Log debug information about the Ollama response."""
         has_keys = hasattr(response, "keys")
         keys_info = response.keys() if has_keys else "Not a dict"
-        logging.debug(f"Raw Ollama response keys: {keys_info}")
+        logger.debug("Raw Ollama response keys: %s", keys_info)
 
     def _estimate_token_count(self, text: str) -> int:
         """Estimate token count for Ollama models."""
-        # Simple approximation: ~4 characters per token
-        return len(text) // 4
+        return _estimate_tokens(text)
 
     def count_tokens(self, text: str) -> int:
         """
@@ -273,10 +655,86 @@ class OllamaProvider(LLMProvider):
         return self._estimate_token_count(text)
 
 
+class CachedLLMProvider(LLMProvider):
+    """
+    Wrapper that memoizes responses of another LLM provider.
+
+    Only exact repeats of a request are served from the cache. Calls above the cache's
+    ``max_temperature`` are always forwarded, since their output is meant to vary between runs.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: Optional[LLMCache] = None) -> None:
+        """
+        Initialize the cached provider.
+
+        Args:
+            provider: The provider whose responses should be cached
+            cache: Cache to use (default: in-memory, one hour TTL, temperatures up to 0.3)
+        """
+        self.provider = provider
+        self.model_name = getattr(provider, "model_name", type(provider).__name__)
+        self.cache = cache if cache is not None else LLMCache(max_temperature=0.3)
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Generate a response, serving exact repeats from the cache."""
+        if not self.cache.is_cacheable(temperature):
+            return await self.provider.generate(messages, temperature, max_tokens, stop)
+
+        key = self.cache.make_key(self.model_name, messages, temperature, max_tokens, stop)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate(messages, temperature, max_tokens, stop)
+        self.cache.set(key, response)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response from the wrapped provider (streams are not cached)."""
+        async for chunk in self.provider.generate_stream(
+            messages, temperature, max_tokens, stop
+        ):
+            yield chunk
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens using the wrapped provider."""
+        return self.provider.count_tokens(text)
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self.cache.clear()
+
+
+# Provider class and default model for each supported provider name
+_PROVIDERS: Dict[str, Tuple[type, str]] = {
+    "openai": (OpenAIProvider, "gpt-4"),
+    "anthropic": (AnthropicProvider, "claude-3-opus-20240229"),
+    "ollama": (OllamaProvider, "deepseek-r1:14b"),
+}
+
+
+@functools.lru_cache(maxsize=16)
 def get_llm_provider(provider_name: str, model_name: Optional[str] = None) -> LLMProvider:
     """
     Factory function to get the appropriate LLM provider.
 
+    Providers are cached per (provider_name, model_name), so repeated calls share one
+    instance along with its connections and caches. Async HTTP clients are created per
+    event loop, so a shared provider also works across successive ``asyncio.run`` calls.
+    Call ``get_llm_provider.cache_clear()`` to force new instances.
+
     Args:
         provider_name: Name of the provider ('openai', 'anthropic', 'ollama')
         model_name: Specific model to use (optional)
@@ -284,11 +742,8 @@ def get_llm_provider(provider_name: str, model_name: Optional[str] = None) -> LL
     Returns:
         An instance of the requested LLM provider
     """
-    if provider_name.lower() == "openai":
-        return OpenAIProvider(model_name or "gpt-4")
-    elif provider_name.lower() == "anthropic":
-        return AnthropicProvider(model_name or "claude-3-opus-20240229")
-    elif provider_name.lower() == "ollama":
-        return OllamaProvider(model_name or "deepseek-r1:14b")
-    else:
-        raise ValueError(f"Unsupported LLM provider: {provider_name}")
+    try:
+        provider_class, default_model = _PROVIDERS[provider_name.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported LLM provider: {provider_name}") from None
+    return provider_class(model_name or default_model)
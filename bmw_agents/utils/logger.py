@@ -2,11 +2,14 @@
 Logging utility for the BMW Agents framework.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
-from typing import Any, Optional
+import time
+from typing import Any, Dict, Optional, Tuple, Union
 
 import colorlog
 
@@ -24,57 +27,110 @@ LOG_COLORS = {
     "CRITICAL": "red,bg_white",
 }
 
+# Formatters are stateless, so every logger shares the same two instances
+_COLOR_FORMATTER = colorlog.ColoredFormatter(
+    DEFAULT_LOG_FORMAT, datefmt=DEFAULT_DATE_FORMAT, log_colors=LOG_COLORS
+)
+_PLAIN_FORMATTER = logging.Formatter(
+    DEFAULT_LOG_FORMAT.replace("%(log_color)s", ""), datefmt=DEFAULT_DATE_FORMAT
+)
+
+# Console handlers shared between loggers, keyed by whether they use colors
+_console_handlers: Dict[bool, logging.Handler] = {}
+
+# Background listeners writing each logger's log file, keyed by logger name
+_file_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+# Settings each logger was last configured with by setup_logger
+_configured: Dict[str, Tuple[int, Optional[str], bool]] = {}
+
 
 def setup_logger(
     name: str = "bmw_agents",
-    level: int = DEFAULT_LOG_LEVEL,
+    level: Union[int, str] = DEFAULT_LOG_LEVEL,
     log_file: str = None,
     use_colors: bool = True,
 ) -> logging.Logger:
     """
     Set up a logger with the given name and level.
 
+    Calling this again with the same settings returns the logger unchanged.
+
     Args:
         name: Name of the logger
-        level: Logging level (default: INFO)
+        level: Logging level, as a number or a name such as "INFO" (default: INFO)
         log_file: Path to log file (default: None, which means log to console only)
         use_colors: Whether to use colored output (default: True)
 
     Returns:
         Configured logger
     """
+    if isinstance(level, str):
+        level_number = logging.getLevelName(level.upper())
+        if not isinstance(level_number, int):
+            raise ValueError(f"Unknown logging level: {level}")
+        level = level_number
+
     logger = logging.getLogger(name)
+    settings = (level, log_file, use_colors)
+    if logger.handlers and _configured.get(name) == settings:
+        return logger
+    _configured[name] = settings
+
     logger.setLevel(level)
 
     # Remove existing handlers to avoid duplicates
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        if handler not in _console_handlers.values():
+            handler.close()
+    _stop_file_listener(name)
 
-    # Create formatter
-    if use_colors:
-        formatter = colorlog.ColoredFormatter(
-            DEFAULT_LOG_FORMAT, datefmt=DEFAULT_DATE_FORMAT, log_colors=LOG_COLORS
-        )
-    else:
-        formatter = logging.Formatter(
-            DEFAULT_LOG_FORMAT.replace("%(log_color)s", ""), datefmt=DEFAULT_DATE_FORMAT
-        )
+    formatter = _COLOR_FORMATTER if use_colors else _PLAIN_FORMATTER
 
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
+    console_handler = _console_handlers.get(use_colors)
+    if console_handler is None:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        _console_handlers[use_colors] = console_handler
     logger.addHandler(console_handler)
 
-    # File handler (if log_file is provided)
+    # File handler (if log_file is provided). Records are handed to a queue and written
+    # by a background thread, so logging calls never wait on file I/O.
     if log_file:
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        _file_listeners[name] = listener
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
 
+def _stop_file_listener(name: str) -> None:
+    """Flush and close the background file writer of a logger, if it has one."""
+    listener = _file_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_file_listeners() -> None:
+    """Flush all pending file log records at interpreter exit."""
+    for name in list(_file_listeners):
+        _stop_file_listener(name)
+
+
 # Create default logger
 logger = setup_logger()
 
@@ -98,18 +154,17 @@ class OperationTimer:
     def __init__(self, logger: logging.Logger, operation_name: str) -> None:
         self.logger = logger
         self.operation_name = operation_name
-        self.start_time: Optional[datetime] = None
+        self.start_ns = 0
 
     def __enter__(self) -> "OperationTimer":
-        self.start_time = datetime.now()
+        self.start_ns = time.perf_counter_ns()
         self.logger.info(f"Starting {self.operation_name}")
         return self
 
     def __exit__(
         self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[Any]
     ) -> None:
-        end_time = datetime.now()
-        duration = (end_time - self.start_time).total_seconds()
+        duration = (time.perf_counter_ns() - self.start_ns) / 1e9
         if exc_type is None:
             self.logger.info(f"Completed {self.operation_name} in {duration:.2f}s")
         else:
@@ -6,12 +6,8 @@ This demonstrates reading and writing CSV files with the fixed CSV tools.
 
 import asyncio
 import os
-import sys
 import tempfile
 
-# Add parent directory to path so we can import from bmw_agents
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from bmw_agents.core.toolbox.tools.file_tools import csv_read, csv_write
 from bmw_agents.utils.logger import setup_logger, get_logger
 
@@ -6,24 +6,23 @@ This demonstrates the ReAct prompt strategy with tools using the Ollama provider
 
 import asyncio
 import datetime
-import json
 import logging
-import os
+import random
 import re
-import sys
-import tempfile
 from typing import Any, Dict, Optional
 
-# Add parent directory to path so we can import from bmw_agents
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from bmw_agents.core.prompt_strategies.react import ReActPromptStrategy, Tool
+from bmw_agents.utils import fast_json
 from bmw_agents.utils.llm_providers import OllamaProvider
 from bmw_agents.utils.logger import setup_logger
 
 # Set up logging
 logger = setup_logger(level=logging.DEBUG)  # Set to DEBUG for more detailed logs
 
+# Patterns used to parse model responses
+_THOUGHT_RE = re.compile(r"Thought:(.*?)(?:Action:|$)", re.DOTALL)
+_ACTION_RE = re.compile(r"Action:(.*?)$", re.DOTALL)
+
 
 # Define some simple tools
 async def get_current_time() -> str:
@@ -43,8 +42,6 @@ async def calculate_product(a: float, b: float) -> float:
 
 async def get_random_number(min_value: float = 0, max_value: float = 100) -> float:
     """Generate a random number between min_value and max_value."""
-    import random
-
     return random.uniform(min_value, max_value)
 
 
@@ -52,22 +49,20 @@ async def get_random_number(min_value: float = 0, max_value: float = 100) -> flo
 def extract_thought_and_action(content: str) -> tuple[str, Optional[dict]]:
     """Extract thought and action from the response for debugging."""
     # Extract thought
-    thought_pattern = r"Thought:(.*?)(?:Action:|$)"
-    thought_match = re.search(thought_pattern, content, re.DOTALL)
+    thought_match = _THOUGHT_RE.search(content)
     thought = thought_match.group(1).strip() if thought_match else ""
 
     # Extract action
-    action_pattern = r"Action:(.*?)$"
-    action_match = re.search(action_pattern, content, re.DOTALL)
+    action_match = _ACTION_RE.search(content)
     action_str = action_match.group(1).strip() if action_match else ""
 
     # Parse action JSON
     action = None
     if action_str:
         try:
-            action = json.loads(action_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing action JSON: {e}")
+            action = fast_json.loads(action_str)
+        except fast_json.JSONDecodeError as e:
+            logger.error("Error parsing action JSON: %s", e)
 
     return thought, action
 
@@ -103,7 +98,7 @@ async def main() -> None:
         ),
     ]
 
-    # Create a temporary file with our custom template
+    # Our custom template
     template_content = """
 You are a helpful AI assistant with access to the following tools:
 
@@ -122,6 +117,18 @@ Action: {{
 The system will respond with the tool's output:
 Observation: <result of the tool call>
 
+You may emit up to 5 independent actions at once when they don't depend on each other's results:
+
+Thought: <your reasoning about what to do next>
+Action: {{
+  "actions": [
+    {{"tool": "<tool_name>", "args": {{"<arg_name>": "<arg_value>"}}}},
+    {{"tool": "<tool_name>", "args": {{"<arg_name>": "<arg_value>"}}}}
+  ]
+}}
+
+The observation will then list one result per action, in the same order.
+
 You MUST repeat this Thought/Action/Observation format for EACH step. ALWAYS start with "Thought:" followed by your reasoning, then "Action:" followed by a JSON object.
 
 After you have all the information needed to answer the user's question, use the following to provide your final answer:
@@ -135,76 +142,80 @@ IMPORTANT:
 4. ONLY use the tools provided.
 """
 
-    # Write the template to a temporary file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as temp:
-        temp.write(template_content)
-        template_path = temp.name
-
-    try:
-        # Create a ReAct prompt strategy with our monkey-patched extraction function
-        react_strategy = ReActPromptStrategy(
-            llm_provider=llm_provider,
-            tools=tools,
-            template_path=template_path,
-            max_iterations=5,
-            termination_sequence="FINAL ANSWER:",
-        )
-
-        # Monkey patch the extract_thought_and_action method for debugging
-        original_extract = react_strategy.extract_thought_and_action
-        react_strategy.extract_thought_and_action = lambda content: (
-            extract_thought_and_action(content),
-            original_extract(content),
-        )[1]
-
-        # Execute the ReAct strategy with a query
-        logger.info("Sending query to Ollama with ReAct strategy...")
-        query = "What is the current time? Then calculate the sum of 123.45 and 678.9, and finally multiply the result by a random number between 1 and 10."
-
-        # Print all messages after each iteration
-        original_get_llm_response = react_strategy.get_llm_response
-
-        async def wrapped_get_llm_response(*args: Any, **kwargs: Any) -> Dict[str, Any]:
-            print("\n--- Current Messages ---")
-            for i, msg in enumerate(react_strategy.messages):
-                print(f"Message {i+1} - {msg.role}: {msg.content[:100]}...")
-            result = await original_get_llm_response(*args, **kwargs)
-            print("\n--- Full Response from LLM ---")
-            print(result["content"])
-            print("\n--- End Response ---")
-            return result
-
-        react_strategy.get_llm_response = wrapped_get_llm_response
-
-        response = await react_strategy.execute(query)
-
-        # Debug: Print raw thoughts, actions, observations
-        print("\n--- Raw Data ---")
-        print("Thoughts:", react_strategy.thoughts)
-        print("Actions:", react_strategy.actions)
-        print("Observations:", react_strategy.observations)
-
-        # Print the execution trace
-        print("\n--- Execution Trace ---")
-        execution_trace = react_strategy.get_execution_trace()
-        print(f"Trace length: {len(execution_trace)}")
-
-        for i, step in enumerate(execution_trace):
-            print(f"Step {i+1}:")
-            print(f"  Thought: {step.get('thought', 'N/A')}")
-            print(f"  Action: {step.get('action', 'N/A')}")
-            print(f"  Observation: {step.get('observation', 'N/A')}")
-            print()
-
-        # Print the final response
-        print("--- Final Answer ---")
-        print(response)
-        print("--------------------\n")
-
-        logger.info("ReAct example completed successfully!")
-    finally:
-        # Clean up the temporary file
-        os.unlink(template_path)
+    # Create a ReAct prompt strategy from the in-memory template
+    react_strategy = ReActPromptStrategy(
+        llm_provider=llm_provider,
+        tools=tools,
+        template_content=template_content,
+        max_iterations=5,
+        termination_sequence="FINAL ANSWER:",
+    )
+
+    # Monkey patch the extract_thought_and_action method for debugging
+    original_extract = react_strategy.extract_thought_and_action
+
+    def debug_extract(content: str) -> Any:
+        # The debug parse only reports problems, so skip it unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            extract_thought_and_action(content)
+        return original_extract(content)
+
+    react_strategy.extract_thought_and_action = debug_extract
+
+    # Execute the ReAct strategy with a query
+    logger.info("Sending query to Ollama with ReAct strategy...")
+    query = "What is the current time? Then calculate the sum of 123.45 and 678.9, and finally multiply the result by a random number between 1 and 10."
+
+    # Print the messages added since the previous LLM call
+    original_get_llm_response = react_strategy.get_llm_response
+    logged_count = 0
+
+    async def wrapped_get_llm_response(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        nonlocal logged_count
+        messages = react_strategy.messages
+        if len(messages) < logged_count:  # history was cleared for a new run
+            logged_count = 0
+        new_lines = [
+            f"Message {i+1} - {messages[i].role}: {messages[i].content[:100]}..."
+            for i in range(logged_count, len(messages))
+        ]
+        print("\n--- New Messages ---\n" + "\n".join(new_lines))
+        logged_count = len(messages)
+        result = await original_get_llm_response(*args, **kwargs)
+        content = result["content"]
+        print(f"\n--- Response from LLM ({len(content)} chars) ---")
+        print(content[:200] + ("..." if len(content) > 200 else ""))
+        print("\n--- End Response ---")
+        return result
+
+    react_strategy.get_llm_response = wrapped_get_llm_response
+
+    response = await react_strategy.execute(query)
+
+    # Debug: Print raw thoughts, actions, observations
+    print("\n--- Raw Data ---")
+    print("Thoughts:", react_strategy.thoughts)
+    print("Actions:", react_strategy.actions)
+    print("Observations:", react_strategy.observations)
+
+    # Print the execution trace
+    print("\n--- Execution Trace ---")
+    execution_trace = react_strategy.get_execution_trace()
+    print(f"Trace length: {len(execution_trace)}")
+
+    for i, step in enumerate(execution_trace):
+        print(f"Step {i+1}:")
+        print(f"  Thought: {step.get('thought', 'N/A')}")
+        print(f"  Action: {step.get('action', 'N/A')}")
+        print(f"  Observation: {step.get('observation', 'N/A')}")
+        print()
+
+    # Print the final response
+    print("--- Final Answer ---")
+    print(response)
+    print("--------------------\n")
+
+    logger.info("ReAct example completed successfully!")
 
 
 if __name__ == "__main__":
@@ -6,11 +6,7 @@ Example demonstrating the Ollama-specific SingleResponseReAct strategy.
 import asyncio
 import datetime
 import logging
-import os
-import sys
-
-# Add parent directory to path so we can import from bmw_agents
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import random
 
 from bmw_agents.core.prompt_strategies.ollama_single_response_react import OllamaSingleResponseReAct
 from bmw_agents.core.prompt_strategies.react import Tool
@@ -40,8 +36,6 @@ async def calculate_product(a: float, b: float) -> float:
 
 async def get_random_number(min_value: float = 0, max_value: float = 100) -> float:
     """Generate a random number between min_value and max_value."""
-    import random
-
     return random.uniform(min_value, max_value)
 
 
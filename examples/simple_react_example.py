@@ -6,22 +6,31 @@ This is a simplified implementation to illustrate the core concepts.
 
 import asyncio
 import datetime
-import json
 import logging
-import os
+import math
+import random
 import re
-import sys
-from typing import Any, Dict, List, Optional, Tuple
-
-# Add parent directory to path so we can import from bmw_agents
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from bmw_agents.utils import fast_json
 from bmw_agents.utils.llm_providers import OllamaProvider
 from bmw_agents.utils.logger import setup_logger
 
+try:
+    import json5
+except ImportError:  # json5 is only used to recover from slightly malformed actions
+    json5 = None
+
 # Set up logging
 logger = setup_logger(level=logging.INFO)
 
+# Patterns used to parse model responses
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_THOUGHT_RE = re.compile(r"\*{0,2}Thought:{0,2}\s*(.*?)(?:\*{0,2}Action:|$)", re.DOTALL)
+_ACTION_RE = re.compile(r"\*{0,2}Action:{0,2}\s*(.*?)(?:\*{0,2}Observation:|$)", re.DOTALL)
+_FINAL_RE = re.compile(r"FINAL ANSWER:\s*(.*)", re.DOTALL)
+
 
 # Define some simple tools
 async def get_current_time() -> str:
@@ -42,48 +51,132 @@ async def calculate_product(a: float, b: float) -> float:
 
 async def get_random_number(min_value: float = 0, max_value: float = 100) -> float:
     """Generate a random number between min_value and max_value."""
-    import random
-
     return random.uniform(min_value, max_value)
 
 
+def has_complete_action(content: str) -> bool:
+    """
+    Check whether a partial response already contains a complete Action JSON object.
+
+    Text inside an unfinished <think> block is ignored, since reasoning models often
+    mention actions while thinking.
+    """
+    think_end = content.rfind("</think>")
+    if think_end < 0 and "<think>" in content:
+        return False
+    action_start = content.find("Action:", think_end + 1 if think_end >= 0 else 0)
+    if action_start < 0:
+        return False
+    brace = content.find("{", action_start)
+    return brace >= 0 and fast_json.object_end(content, brace) >= 0
+
+
 def extract_thought_and_action(content: str) -> Tuple[str, Optional[Dict[str, Any]]]:
     """
     Extract thought and action from LLM response.
     """
     # Remove <think>...</think> tags if present
-    content = re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL)
+    content = _THINK_RE.sub("", content)
 
     # Extract thought - handle both with and without asterisks
-    thought_match = re.search(
-        r"\*{0,2}Thought:{0,2}\s*(.*?)(?:\*{0,2}Action:|$)", content, re.DOTALL
-    )
+    thought_match = _THOUGHT_RE.search(content)
     thought = thought_match.group(1).strip() if thought_match else ""
 
     # Extract action - handle both with and without asterisks
-    action_match = re.search(
-        r"\*{0,2}Action:{0,2}\s*(.*?)(?:\*{0,2}Observation:|$)", content, re.DOTALL
-    )
+    action_match = _ACTION_RE.search(content)
     action_text = action_match.group(1).strip() if action_match else ""
 
     # Parse action JSON
     action = None
     if action_text:
+        # Clean up JSON - sometimes models add extra text around the object
+        json_text = fast_json.first_object(action_text) or action_text
         try:
-            # Clean up JSON - sometimes models add extra text
-            json_text = action_text
-            json_match = re.search(r"({.*})", json_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(1)
-
-            action = json.loads(json_text)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse action JSON: {e}")
-            logger.error(f"Raw action text: {action_text}")
+            action = fast_json.loads(json_text)
+        except fast_json.JSONDecodeError as e:
+            if json5 is not None:
+                try:
+                    action = json5.loads(json_text)
+                except ValueError:
+                    pass
+            if action is None:
+                logger.error("Failed to parse action JSON: %s", e)
+                logger.error("Raw action text: %s", action_text)
 
     return thought, action
 
 
+class ThinkFilter:
+    """
+    Forward streamed text to a callback, dropping <think>...</think> blocks.
+
+    Tags may be split across chunks, so a trailing fragment that could start a tag is
+    held back until the next chunk shows whether it is one.
+    """
+
+    def __init__(self, emit: Callable[[str], None]) -> None:
+        """Initialize with the callback that receives the visible text."""
+        self.emit = emit
+        self._in_think = False
+        self._pending = ""
+
+    def feed(self, chunk: str) -> None:
+        """Process the next chunk of streamed text."""
+        text = self._pending + chunk
+        self._pending = ""
+        while text:
+            tag = "</think>" if self._in_think else "<think>"
+            index = text.find(tag)
+            if index >= 0:
+                if not self._in_think and index:
+                    self.emit(text[:index])
+                text = text[index + len(tag) :]
+                self._in_think = not self._in_think
+                continue
+
+            # Hold back the longest suffix that could be the start of the tag
+            longest = min(len(tag) - 1, len(text))
+            held = next((n for n in range(longest, 0, -1) if tag.startswith(text[-n:])), 0)
+            if not self._in_think and len(text) > held:
+                self.emit(text[: len(text) - held])
+            self._pending = text[len(text) - held :]
+            break
+
+    def flush(self) -> None:
+        """Emit any text held back at the end of a response."""
+        if self._pending and not self._in_think:
+            self.emit(self._pending)
+        self._pending = ""
+        self._in_think = False
+
+
+def fast_path(query: str, tools: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Map a trivial single-step query straight to a tool call, bypassing the model.
+
+    A tool opts in with a "fast_path" regex that must match the whole query, so anything
+    with extra steps falls through to the LLM. Named groups become the tool arguments
+    and are parsed as numbers.
+
+    Returns:
+        The action to execute, or None if the query needs the model
+    """
+    query = query.strip()
+    for tool in tools:
+        pattern = tool.get("fast_path")
+        if pattern is None:
+            continue
+        match = pattern.fullmatch(query)
+        if match is None:
+            continue
+        try:
+            args = {name: float(value) for name, value in match.groupdict().items()}
+        except ValueError:
+            continue
+        return {"tool": tool["name"], "args": args}
+    return None
+
+
 class SimpleReAct:
     """
     A simplified implementation of the ReAct strategy.
@@ -94,11 +187,22 @@ class SimpleReAct:
         llm_provider: Any,
         tools: Optional[List[Dict[str, Any]]] = None,
         max_iterations: int = 5,
+        max_concurrency: int = 4,
     ) -> None:
         """Initialize with an LLM provider and tools."""
         self.llm_provider = llm_provider
         self.tools = tools or []
         self.max_iterations = max_iterations
+        self.max_concurrency = max_concurrency
+
+        # Tools are fixed after construction, so index them and describe them once
+        self._tool_by_name: Dict[str, Dict[str, Any]] = {tool["name"]: tool for tool in self.tools}
+        self._tool_descriptions = "\n".join(
+            f"Tool: {tool['name']}\nDescription: {tool['description']}\n" for tool in self.tools
+        )
+
+        # Results of cacheable tool calls: (tool name, args JSON) -> (expiry time, result)
+        self._tool_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
 
         # Store execution trace
         self.thoughts: List[str] = []
@@ -108,24 +212,46 @@ class SimpleReAct:
 
     def get_tool_descriptions(self) -> str:
         """Get formatted descriptions of available tools."""
-        descriptions = []
-        for tool in self.tools:
-            description = f"Tool: {tool['name']}\nDescription: {tool['description']}\n"
-            descriptions.append(description)
-        return "\n".join(descriptions)
+        return self._tool_descriptions
 
     def find_tool_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Find a tool by name."""
-        for tool in self.tools:
-            if tool["name"] == name:
-                return tool
-        return None
+        # Models occasionally emit a non-string tool name, which can't be a dict key
+        return self._tool_by_name.get(name) if isinstance(name, str) else None
 
     async def execute_action(self, action: Optional[Dict[str, Any]]) -> str:
-        """Execute a tool action and return the result."""
+        """
+        Execute a tool action and return the result.
+
+        An action of the form {"actions": [...]} runs each listed action concurrently,
+        at most ``max_concurrency`` at a time, and reports the results in the same order.
+        """
         if not action:
             return "No action specified"
 
+        actions = action.get("actions")
+        if isinstance(actions, list):
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def execute_limited(single_action: Dict[str, Any]) -> str:
+                async with semaphore:
+                    return await self.execute_single_action(single_action)
+
+            results = await asyncio.gather(*(execute_limited(a) for a in actions))
+            return "\n".join(f"Result {i}: {result}" for i, result in enumerate(results, 1))
+
+        return await self.execute_single_action(action)
+
+    async def execute_single_action(self, action: Dict[str, Any]) -> str:
+        """
+        Execute a single tool call and return the result.
+
+        Tools that declare a "cache_ttl" (in seconds, math.inf for pure functions) have their
+        successful results reused for identical arguments until the TTL expires.
+        """
+        if not isinstance(action, dict):
+            return f"Error: Invalid action {action!r}"
+
         tool_name = action.get("tool")
         args = action.get("args", {})
 
@@ -133,17 +259,84 @@ class SimpleReAct:
         if not tool:
             return f"Error: Tool '{tool_name}' not found"
 
+        cache_ttl = tool.get("cache_ttl")
+        cache_key = None
+        if cache_ttl:
+            try:
+                cache_key = (tool_name, fast_json.dumps(args, sort_keys=True))
+            except TypeError:
+                pass  # Arguments that aren't JSON serializable are never cached
+            else:
+                cached = self._tool_cache.get(cache_key)
+                if cached is not None and cached[0] > time.monotonic():
+                    return cached[1]
+
         try:
-            result = await tool["function"](**args)
-            return str(result)
+            result = str(await tool["function"](**args))
+            if cache_key is not None:
+                self._tool_cache[cache_key] = (time.monotonic() + cache_ttl, result)
+            return result
         except Exception as e:
-            logger.error(f"Error executing tool: {e}")
+            logger.error("Error executing tool: %s", e)
             return f"Error executing tool: {str(e)}"
 
-    async def run(self, instruction: str) -> Dict[str, Any]:
-        """Run the ReAct strategy with the given instruction."""
+    async def get_next_response(self, on_token: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Stream the model's next turn.
+
+        The stream is closed as soon as a complete action has been emitted, because
+        anything the model writes after it (such as an imagined observation) is discarded.
+
+        Args:
+            on_token: Called with each chunk of the response as it arrives
+        """
+        content = ""
+        stream = self.llm_provider.generate_stream(
+            self.messages, temperature=0.7, stop=["\nObservation:"]
+        )
+        try:
+            async for chunk in stream:
+                content += chunk
+                if on_token is not None:
+                    on_token(chunk)
+                if "}" in chunk and has_complete_action(content):
+                    break
+        finally:
+            # Closing the generator aborts the request on the provider side
+            await stream.aclose()
+        return content
+
+    async def run(
+        self,
+        instruction: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        show_thinking: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Run the ReAct strategy with the given instruction.
+
+        Args:
+            instruction: The user query
+            on_token: Called with the model output as it streams in, so callers can show
+                progress before the run finishes
+            show_thinking: Whether on_token also receives <think> blocks
+        """
         logger.info("Starting ReAct execution")
 
+        # Deterministic one-step queries don't need the model at all
+        direct_action = fast_path(instruction, self.tools)
+        if direct_action is not None:
+            logger.info("Answering directly with %s", direct_action["tool"])
+            observation = await self.execute_single_action(direct_action)
+            return {
+                "result": observation,
+                "trace": {
+                    "thoughts": ["Answered directly without calling the model"],
+                    "actions": [direct_action],
+                    "observations": [observation],
+                },
+            }
+
         # Create system message with tools and instructions
         system_message = f"""You are a helpful AI assistant with access to the following tools:
 
@@ -162,6 +355,18 @@ Action: {{
 The system will respond with the tool's output:
 Observation: <result of the tool call>
 
+If several tool calls don't depend on each other's results, you can make them at once:
+
+Thought: <your reasoning about what to do next>
+Action: {{
+  "actions": [
+    {{"tool": "<tool_name>", "args": {{"<arg_name>": "<arg_value>"}}}},
+    {{"tool": "<tool_name>", "args": {{"<arg_name>": "<arg_value>"}}}}
+  ]
+}}
+
+The observation will then list one result per action, in the same order.
+
 After you have all the information needed to answer the user's question, use:
 
 FINAL ANSWER: <your final answer>
@@ -189,14 +394,20 @@ Remember to:
 
         while iteration_count < self.max_iterations and final_answer is None:
             iteration_count += 1
-            logger.info(f"Iteration {iteration_count}")
+            logger.info("Iteration %s", iteration_count)
 
             # Get response from model
-            response = await self.llm_provider.generate(self.messages, temperature=0.7)
-            content = response["content"]
+            think_filter = None
+            if on_token is not None and not show_thinking:
+                think_filter = ThinkFilter(on_token)
+            content = await self.get_next_response(
+                think_filter.feed if think_filter is not None else on_token
+            )
+            if think_filter is not None:
+                think_filter.flush()
 
             # Check for final answer
-            final_answer_match = re.search(r"FINAL ANSWER:\s*(.*)", content, re.DOTALL)
+            final_answer_match = _FINAL_RE.search(content)
             if final_answer_match:
                 final_answer = final_answer_match.group(1).strip()
                 break
@@ -212,7 +423,8 @@ Remember to:
             observation = await self.execute_action(action) if action else "No action to execute"
             self.observations.append(observation)
 
-            # Add to conversation
+            # Only append to the history: earlier messages stay byte-identical between turns,
+            # so Ollama reuses the KV cache for the shared prefix and prefills just the new turn
             self.messages.append({"role": "assistant", "content": content})
             self.messages.append({"role": "user", "content": f"Observation: {observation}"})
 
@@ -243,16 +455,27 @@ async def main() -> None:
             "name": "get_current_time",
             "description": "Get the current date and time",
             "function": get_current_time,
+            "fast_path": re.compile(
+                r"(?:what is |what's )?(?:the )?current (?:date and )?(?:time|date)\W*",
+                re.IGNORECASE,
+            ),
         },
         {
             "name": "calculate_sum",
             "description": "Calculate the sum of two numbers",
             "function": calculate_sum,
+            "cache_ttl": math.inf,  # Pure function, so results never go stale
+            "fast_path": re.compile(
+                r"(?:what is )?(?:the )?sum of "
+                r"(?P<a>-?\d+(?:\.\d+)?) and (?P<b>-?\d+(?:\.\d+)?)\W*",
+                re.IGNORECASE,
+            ),
         },
         {
             "name": "calculate_product",
             "description": "Calculate the product of two numbers",
             "function": calculate_product,
+            "cache_ttl": math.inf,
         },
         {
             "name": "get_random_number",
@@ -267,8 +490,9 @@ async def main() -> None:
     # Run the strategy with a user query
     user_query = "What is the current time? Then calculate the sum of 123.45 and 678.9, and finally multiply the result by a random number between 1 and 10."
 
-    logger.info(f"Running query: {user_query}")
-    result = await react.run(user_query)
+    logger.info("Running query: %s", user_query)
+    result = await react.run(user_query, on_token=lambda text: print(text, end="", flush=True))
+    print()
 
     # Print the execution trace
     print("\n--- Execution Trace ---")
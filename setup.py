@@ -52,5 +52,12 @@ setup(
             "isort>=5.12.0",
             "mypy>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "google-re2>=1.0",
+            "pyarrow>=10.0.0",
+            "ijson>=3.1",
+            "msgpack>=1.0",
+        ],
     },
 )
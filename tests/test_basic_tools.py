@@ -0,0 +1,141 @@
+"""
+Tests for the basic tools.
+"""
+
+import asyncio
+import gc
+import json
+import math
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bmw_agents.core.toolbox.tools.basic_tools import (
+    close_http_sessions,
+    create_basic_toolbox,
+    datetime_add,
+    json_parse,
+    json_stringify,
+    math_elementwise,
+    text_contains,
+    text_extract,
+    text_regex_replace,
+    web_get_async,
+)
+
+
+@pytest.mark.parametrize("name", ["math.add", "math.divide", "math.power"])
+def test_math_tools_expose_float_parameters(name):
+    parameters = create_basic_toolbox().get_tool(name).parameters
+
+    assert {info["type"] for info in parameters.values()} == {"float"}
+
+
+def test_datetime_tools_expose_str_parameters():
+    toolbox = create_basic_toolbox()
+
+    assert toolbox.get_tool("datetime.add").parameters["timestamp"]["type"] == "str"
+    assert toolbox.get_tool("datetime.format").parameters["timestamp"]["type"] == "str"
+    assert "datetime.now_obj" not in toolbox.tools
+
+
+def test_datetime_add_returns_iso_string():
+    assert datetime_add("2024-01-31T12:00:00", days=1, hours=2) == "2024-02-01T14:00:00"
+
+
+def test_math_elementwise():
+    assert math_elementwise("add", [1, 2], [3, 4]) == [4.0, 6.0]
+    assert math_elementwise("sqrt", [4, 9]) == [2.0, 3.0]
+    with pytest.raises(ValueError):
+        math_elementwise("divide", [1, 2], [1, 0])
+    with pytest.raises(ValueError):
+        math_elementwise("add", [1, 2])
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a": 123456789012345678901234567890}', "[-92233720368547758090]", "[1.5, 2]", "[1e400]"],
+)
+def test_json_parse_matches_json_loads(text):
+    assert json_parse(text) == json.loads(text)
+
+
+def test_json_parse_accepts_non_finite_literals():
+    assert json_parse("Infinity") == float("inf")
+    assert math.isnan(json_parse("[NaN]")[0])
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_stringify_matches_json_dumps(pretty):
+    obj = {"name": "café", "values": [1, 2.5, None], "ratio": float("inf")}
+
+    assert json_stringify(obj, pretty=pretty) == json.dumps(obj, indent=2 if pretty else None)
+
+
+def test_text_contains_case_insensitive():
+    assert text_contains("Hello World", "WORLD", case_sensitive=False)
+    assert not text_contains("Hello World", "WORLD")
+
+
+def test_regex_tools_use_re_by_default():
+    assert text_extract("café naïve", r"\w+") == ["café", "naïve"]
+    assert text_regex_replace("a\n", "a$", "b") == "b\n"
+
+
+def test_regex_tools_re2_engine():
+    pytest.importorskip("re2")
+
+    assert text_extract("x1 y22", r"\d+", engine="re2") == ["1", "22"]
+    assert text_regex_replace("aaa", "a+", "b", engine="re2") == "b"
+    with pytest.raises(ValueError):
+        text_extract("abab", r"(ab)\1", engine="re2")
+
+
+def test_regex_tools_reject_unknown_engines():
+    with pytest.raises(ValueError):
+        text_extract("abc", "b", engine="pcre")
+
+
+class _TextHandler(BaseHTTPRequestHandler):
+    """Answers every GET request with a short text body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def text_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TextHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_web_get_async_across_event_loops(text_server):
+    pytest.importorskip("aiohttp")
+
+    async def fetch():
+        try:
+            return await web_get_async(text_server)
+        finally:
+            await close_http_sessions()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        assert asyncio.run(fetch()) == "ok"
+        assert asyncio.run(fetch()) == "ok"
+        gc.collect()
@@ -0,0 +1,91 @@
+"""
+Tests for the file tools fast paths.
+"""
+
+import math
+import os
+
+import pytest
+
+from bmw_agents.core.toolbox.tools import file_tools
+from bmw_agents.core.toolbox.tools.file_tools import (
+    _copy_file_range,
+    file_copy,
+    file_read,
+    json_read,
+    json_write,
+)
+
+requires_copy_file_range = pytest.mark.skipif(
+    not hasattr(os, "copy_file_range"), reason="os.copy_file_range is not available"
+)
+
+
+@requires_copy_file_range
+def test_copy_file_range_copies_data(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(200_000))
+    destination = tmp_path / "destination.bin"
+
+    if not _copy_file_range(str(source), str(destination)):
+        pytest.skip("copy_file_range is not supported on this filesystem")
+    assert destination.read_bytes() == source.read_bytes()
+
+
+@requires_copy_file_range
+def test_copy_file_range_reports_short_copy(tmp_path, monkeypatch):
+    source = tmp_path / "source.txt"
+    source.write_text("data" * 1000)
+    # Filesystems such as FUSE may return 0 before all data has been copied
+    monkeypatch.setattr(file_tools.os, "copy_file_range", lambda *args: 0)
+
+    assert _copy_file_range(str(source), str(tmp_path / "destination.txt")) is False
+
+
+@requires_copy_file_range
+def test_copy_file_range_skips_zero_size_sources(tmp_path):
+    source = tmp_path / "empty.txt"
+    source.write_text("")
+
+    assert _copy_file_range(str(source), str(tmp_path / "destination.txt")) is False
+
+
+def test_file_copy_falls_back_after_short_copy(tmp_path, monkeypatch):
+    source = tmp_path / "source.txt"
+    source.write_text("data" * 1000)
+    destination = tmp_path / "destination.txt"
+    monkeypatch.setattr(file_tools.os, "copy_file_range", lambda *args: 0, raising=False)
+
+    assert file_copy(str(source), str(destination)) is True
+    assert destination.read_text() == source.read_text()
+
+
+def test_file_read_handles_short_reads(tmp_path, monkeypatch):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello world\n" * 100)
+    real_read = os.read
+    # Return at most 7 bytes per call, as a short read would
+    monkeypatch.setattr(file_tools.os, "read", lambda fd, size: real_read(fd, min(size, 7)))
+
+    assert file_read(str(path)) == "hello world\n" * 100
+
+
+def test_file_read_normalizes_newlines(tmp_path):
+    path = tmp_path / "crlf.txt"
+    path.write_bytes("café\r\nline\rend".encode("utf-8"))
+
+    assert file_read(str(path)) == "café\nline\nend"
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_json_write_and_read_round_trip(tmp_path, indent):
+    path = tmp_path / "data.json"
+    data = {"big": 123456789012345678901234567890, "values": [1.5, -2**63, None], "name": "café"}
+    data["ratio"] = float("nan")
+
+    assert json_write(str(path), data, indent=indent) is True
+    result = json_read(str(path))
+
+    assert math.isnan(result.pop("ratio"))
+    del data["ratio"]
+    assert result == data
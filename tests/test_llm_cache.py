@@ -0,0 +1,84 @@
+"""
+Tests for the LLM response cache.
+"""
+
+from bmw_agents.utils.llm_cache import LLMCache, MemoryCacheBackend
+
+MESSAGES = [{"role": "user", "content": "What is 2 + 2?"}]
+
+
+def make_response():
+    return {"content": "4", "usage": {"prompt_tokens": 5, "completion_tokens": 1}}
+
+
+def test_get_counts_hits_and_misses():
+    cache = LLMCache()
+    key = cache.make_key("model", MESSAGES, 0.0, None)
+
+    assert cache.get(key) is None
+    cache.set(key, make_response())
+    assert cache.get(key) == make_response()
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_make_key_covers_sampling_parameters():
+    keys = {
+        LLMCache.make_key("model", MESSAGES, 0.0, None),
+        LLMCache.make_key("other", MESSAGES, 0.0, None),
+        LLMCache.make_key("model", MESSAGES, 0.2, None),
+        LLMCache.make_key("model", MESSAGES, 0.0, 64),
+        LLMCache.make_key("model", MESSAGES, 0.0, None, ["Observation:"]),
+    }
+    assert len(keys) == 5
+
+
+def test_cached_responses_are_isolated_from_callers():
+    cache = LLMCache()
+    key = cache.make_key("model", MESSAGES, 0.0, None)
+    response = make_response()
+    cache.set(key, response)
+
+    response["usage"]["prompt_tokens"] = 100
+    returned = cache.get(key)
+    returned["usage"]["completion_tokens"] = 100
+
+    assert cache.get(key) == make_response()
+
+
+def test_is_cacheable_respects_max_temperature():
+    cache = LLMCache(max_temperature=0.3)
+
+    assert cache.is_cacheable(0.3)
+    assert not cache.is_cacheable(0.7)
+
+
+def test_expired_entries_are_misses(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("bmw_agents.utils.llm_cache.time.monotonic", lambda: now[0])
+    cache = LLMCache(ttl=10)
+    cache.set("key", make_response())
+
+    now[0] += 11
+    assert cache.get("key") is None
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", {"content": "a"})
+    backend.set("b", {"content": "b"})
+    backend.get("a")
+    backend.set("c", {"content": "c"})
+
+    assert backend.get("b") is None
+    assert backend.get("a") == {"content": "a"}
+    assert backend.get("c") == {"content": "c"}
+
+
+def test_clear_resets_entries_and_stats():
+    cache = LLMCache()
+    cache.set("key", make_response())
+    cache.get("key")
+    cache.clear()
+
+    assert cache.stats == {"hits": 0, "misses": 0}
+    assert cache.get("key") is None
@@ -0,0 +1,80 @@
+"""
+Tests for the LLM providers.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bmw_agents.utils.llm_providers import get_llm_provider
+
+
+class _OllamaStubHandler(BaseHTTPRequestHandler):
+    """Answers every chat request with a fixed assistant message."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.requests.append(json.loads(self.rfile.read(length)))
+        body = json.dumps(
+            {
+                "model": "stub",
+                "created_at": "2024-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": "pong"},
+                "done": True,
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ollama_stub(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaStubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OLLAMA_HOST", f"http://127.0.0.1:{server.server_port}")
+    _OllamaStubHandler.requests = []
+    get_llm_provider.cache_clear()
+    yield _OllamaStubHandler.requests
+    get_llm_provider.cache_clear()
+    server.shutdown()
+    server.server_close()
+
+
+async def _ask() -> str:
+    provider = get_llm_provider("ollama")
+    response = await provider.generate([{"role": "user", "content": "ping"}], stop=["\nEnd"])
+    return response["content"]
+
+
+def test_get_llm_provider_returns_shared_instance(ollama_stub):
+    assert get_llm_provider("ollama") is get_llm_provider("ollama")
+
+
+def test_shared_ollama_provider_works_across_event_loops(ollama_stub):
+    assert asyncio.run(_ask()) == "pong"
+    assert asyncio.run(_ask()) == "pong"
+    assert len(ollama_stub) == 2
+
+
+def test_ollama_provider_sends_stop_sequences(ollama_stub):
+    asyncio.run(_ask())
+
+    assert ollama_stub[0]["options"]["stop"] == ["\nEnd"]
+
+
+def test_get_llm_provider_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        get_llm_provider("unknown")
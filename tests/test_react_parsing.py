@@ -0,0 +1,69 @@
+"""
+Tests for action parsing in the ReAct prompt strategy.
+"""
+
+from bmw_agents.core.prompt_strategies.react import ReActPromptStrategy
+from bmw_agents.utils import fast_json
+
+
+def make_strategy():
+    return ReActPromptStrategy(None, template_content="{instruction}")
+
+
+def test_object_end_ignores_braces_in_strings():
+    text = 'Action: {"tool": "echo", "args": {"text": "} {"}} trailing'
+    start = text.index("{")
+
+    assert text[: fast_json.object_end(text, start)].endswith('"} {"}}')
+
+
+def test_object_end_reports_unclosed_objects():
+    assert fast_json.object_end('{"tool": "echo", "args": {', 0) == -1
+
+
+def test_first_object_returns_none_without_objects():
+    assert fast_json.first_object("no json here") is None
+
+
+def test_parse_action_batch_ignores_trailing_braces():
+    action_str = (
+        '{"actions": [{"tool": "a", "args": {}}, {"tool": "b", "args": {"x": 1}}]}\n'
+        "I will wait for {results}."
+    )
+
+    assert ReActPromptStrategy._parse_action_batch(action_str) == {
+        "actions": [{"tool": "a", "args": {}}, {"tool": "b", "args": {"x": 1}}]
+    }
+
+
+def test_parse_action_batch_drops_entries_without_a_tool():
+    action_str = '{"actions": [{"tool": "a"}, {"args": {}}, "text"]}'
+
+    assert ReActPromptStrategy._parse_action_batch(action_str) == {"actions": [{"tool": "a"}]}
+
+
+def test_parse_action_batch_rejects_other_objects():
+    assert ReActPromptStrategy._parse_action_batch('{"tool": "a"}') is None
+    assert ReActPromptStrategy._parse_action_batch('{"actions": [}') is None
+
+
+def test_extract_thought_and_action_returns_batch():
+    content = (
+        "Thought: do both\n"
+        'Action: {"actions": [{"tool": "a", "args": {}}, {"tool": "b", "args": {}}]}\n'
+        "I will wait for {results}."
+    )
+
+    thought, action = make_strategy().extract_thought_and_action(content)
+
+    assert thought == "do both"
+    assert action == {"actions": [{"tool": "a", "args": {}}, {"tool": "b", "args": {}}]}
+
+
+def test_extract_thought_and_action_returns_single_action():
+    content = 'Thought: look it up\nAction: {"tool": "search", "args": {"q": "x"}}'
+
+    thought, action = make_strategy().extract_thought_and_action(content)
+
+    assert thought == "look it up"
+    assert action == {"tool": "search", "args": {"q": "x"}}
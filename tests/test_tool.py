@@ -0,0 +1,17 @@
+"""
+Tests for the tool classes.
+"""
+
+from bmw_agents.core.toolbox.tool import SimpleTool
+from bmw_agents.core.toolbox.tools.basic_tools import create_basic_toolbox, math_add
+
+
+def test_parameter_descriptions_do_not_leak_into_other_tools():
+    original_doc = math_add.__doc__
+    tool = SimpleTool("my_add", "custom", math_add, parameter_descriptions={"a": "Left operand"})
+
+    assert tool.parameters["a"]["description"] == "Left operand"
+    assert math_add.__doc__ == original_doc
+    parameters = create_basic_toolbox().get_tool("math.add").parameters
+    assert parameters["a"]["description"] == "First number"
+    assert parameters["b"]["description"] == "Second number"
@@ -0,0 +1,24 @@
+"""
+Tests for the toolbox refiner.
+"""
+
+import re
+
+from bmw_agents.core.toolbox.toolbox_refiner import ToolboxRefiner, _literal_prefix
+from bmw_agents.core.toolbox.tools.basic_tools import create_basic_toolbox
+
+
+def test_literal_prefix():
+    assert _literal_prefix(re.compile(r"^math\.add")) == "math"
+    assert _literal_prefix(re.compile(r"^math\.ad?")) == "math"
+    assert _literal_prefix(re.compile(r"^math", re.IGNORECASE)) is None
+    assert _literal_prefix(re.compile(r"^math \. add", re.VERBOSE)) is None
+
+
+def test_exclude_pattern_honours_verbose_flag():
+    refiner = ToolboxRefiner(create_basic_toolbox())
+
+    refiner.exclude_pattern(re.compile(r"^math \. add", re.VERBOSE))
+
+    assert "math.add" not in refiner.refined_toolbox.tools
+    assert "math.subtract" in refiner.refined_toolbox.tools
@@ -0,0 +1,56 @@
+"""
+Tests for the traced prompt strategies.
+"""
+
+import asyncio
+
+from bmw_agents.core.prompt_strategies.single_response_traced_react import (
+    SingleResponseTracedReAct,
+)
+from bmw_agents.core.toolbox.tool import SimpleTool
+
+
+class FakeProvider:
+    """Returns the queued responses in order."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    async def generate(self, messages, temperature=0.7, max_tokens=None, stop=None):
+        return {"content": self.responses.pop(0)}
+
+
+def test_run_keeps_earlier_traces_intact(tmp_path):
+    template = tmp_path / "template.txt"
+    template.write_text("{instruction}\n{tools}\n{termination_sequence}")
+    provider = FakeProvider(
+        [
+            "Thought: first\nAction: {}\nObservation: one\nFINAL ANSWER: 1",
+            "FINAL ANSWER: 2",
+        ]
+    )
+    strategy = SingleResponseTracedReAct(provider, template_path=str(template))
+
+    first = asyncio.run(strategy.run("first question"))
+    second = asyncio.run(strategy.run("second question"))
+
+    assert first["result"] == "1"
+    assert first["trace"]["thoughts"] == ["first"]
+    assert first["trace"]["observations"] == ["one"]
+    assert second["result"] == "2"
+    assert second["trace"]["thoughts"] == []
+
+
+def test_single_tool_is_inferred_for_actions_without_a_tool(tmp_path):
+    template = tmp_path / "template.txt"
+    template.write_text("{instruction}\n{tools}\n{termination_sequence}")
+    provider = FakeProvider(
+        ['Thought: add them\nAction: {"args": {"a": 2, "b": 3}}\nObservation:\nFINAL ANSWER: 5']
+    )
+    tool = SimpleTool("math.add", "Add two numbers", lambda a, b: a + b)
+    strategy = SingleResponseTracedReAct(provider, tools=[tool], template_path=str(template))
+
+    output = asyncio.run(strategy.run("add 2 and 3"))
+
+    assert output["trace"]["actions"] == [{"args": {"a": 2, "b": 3}, "tool": "math.add"}]
+    assert output["trace"]["observations"] == ["5"]